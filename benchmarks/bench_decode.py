@@ -0,0 +1,149 @@
+"""Micro-benchmark of per-frame WebSocket decoding and dispatch cost.
+
+Compares the original path (stdlib json.loads of every frame, then an
+if/elif chain) with the current one (type sniffing, orjson when installed,
+dict-based handler lookup).
+
+Usage: python benchmarks/bench_decode.py [--frames N] [--ignored-ratio R]
+"""
+from __future__ import annotations
+
+import argparse
+import ast
+import importlib.util
+import json
+from pathlib import Path
+import random
+import timeit
+from typing import Any
+
+_COMPONENT = (
+    Path(__file__).resolve().parents[1] / "custom_components" / "roon_now_playing"
+)
+
+# Load protocol.py directly; it has no Home Assistant dependencies
+_spec = importlib.util.spec_from_file_location(
+    "rnp_protocol", _COMPONENT / "protocol.py"
+)
+protocol = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(protocol)
+
+
+def _handled_types() -> tuple[str, ...]:
+    """Return the keys of the coordinator's handler table.
+
+    Read from the source so the benchmark needs no Home Assistant install
+    and stays in step with the message types the coordinator decodes.
+    """
+    tree = ast.parse((_COMPONENT / "coordinator.py").read_text(encoding="utf-8"))
+    for node in ast.walk(tree):
+        if (
+            isinstance(node, ast.AnnAssign)
+            and isinstance(node.target, ast.Attribute)
+            and node.target.attr == "_handlers"
+            and isinstance(node.value, ast.Dict)
+        ):
+            return tuple(key.value for key in node.value.keys)
+    raise RuntimeError("Handler table not found in coordinator.py")
+
+
+HANDLED_TYPES = _handled_types()
+# A frame the server sends that the coordinator has no handler for
+IGNORED_TYPE = "queue_changed"
+assert IGNORED_TYPE not in HANDLED_TYPES
+
+
+def build_frames(count: int, ignored_ratio: float, seed: int = 1) -> list[str]:
+    """Return a mix of handled client updates and ignored queue frames."""
+    rng = random.Random(seed)
+    frames = []
+    for index in range(count):
+        if rng.random() < ignored_ratio:
+            frames.append(
+                json.dumps(
+                    {
+                        "type": IGNORED_TYPE,
+                        "zoneId": f"zone-{index % 8}",
+                        "queue_items_remaining": 12 - index % 12,
+                        "queue_time_remaining": 180 - index % 180,
+                    }
+                )
+            )
+        else:
+            frames.append(
+                json.dumps(
+                    {
+                        "type": "client_updated",
+                        "client": {
+                            "clientId": f"client-{index % 100}",
+                            "friendlyName": f"Screen {index % 100}",
+                            "layout": "detailed",
+                            "font": "inter",
+                            "background": "dominant",
+                            "zoneId": f"zone-{index % 8}",
+                            "zoneName": f"Zone {index % 8}",
+                            "userAgent": "Mozilla/5.0 (X11; Linux armv7l)",
+                            "connectedAt": "2025-02-02T10:00:00.000Z",
+                        },
+                    }
+                )
+            )
+    return frames
+
+
+def before(frames: list[str]) -> int:
+    """Original path: stdlib decode of every frame plus an if/elif chain."""
+    handled = 0
+    for frame in frames:
+        data: dict[str, Any] = json.loads(frame)
+        msg_type = data.get("type")
+        if msg_type == "clients_list":
+            handled += 1
+        elif msg_type == "client_connected":
+            handled += 1
+        elif msg_type == "client_disconnected":
+            handled += 1
+        elif msg_type == "client_updated":
+            handled += 1
+        elif msg_type == "zones":
+            handled += 1
+    return handled
+
+
+def after(frames: list[str]) -> int:
+    """Current path: sniff, skip unhandled types, fast decode, dict dispatch."""
+    loads = protocol.get_json_loads()
+    handlers = dict.fromkeys(HANDLED_TYPES, 1)
+    handled = 0
+    for frame in frames:
+        msg_type = protocol.sniff_type(frame)
+        if msg_type is not None and msg_type not in handlers:
+            continue
+        data = loads(frame)
+        handled += handlers.get(data.get("type"), 0)
+    return handled
+
+
+def main() -> None:
+    """Run the benchmark and print per-frame costs."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=20000)
+    parser.add_argument("--ignored-ratio", type=float, default=0.8)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    frames = build_frames(args.frames, args.ignored_ratio)
+    assert before(frames) == after(frames)
+
+    decoder = "orjson" if protocol.orjson is not None else "json (stdlib)"
+    print(f"{args.frames} frames, {args.ignored_ratio:.0%} ignored, decoder: {decoder}")
+    results = {}
+    for name, func in (("before", before), ("after", after)):
+        best = min(timeit.repeat(lambda: func(frames), number=1, repeat=args.repeat))
+        results[name] = best / args.frames * 1e6
+        print(f"  {name:<7} {results[name]:7.2f} us/frame")
+    print(f"  speedup {results['before'] / results['after']:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
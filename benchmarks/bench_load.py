@@ -0,0 +1,284 @@
+"""Load and latency benchmark of the integration against a fake server.
+
+Sets the integration up in a test Home Assistant instance (coordinator,
+select and binary_sensor platforms) against benchmarks/fake_server.py and
+runs, for each fleet size:
+
+- setup: time until every entity exists, and traced memory per screen
+- updates: client_updated frames sent as fast as possible; messages/sec
+  until the state is consistent, and frame-to-state-write latency
+- reconnect storm: the server drops the socket repeatedly; time until the
+  resent clients_list is applied, and state writes caused by it
+- bulk push: apply_profile to every screen over REST (the bulk endpoint, as
+  the fake server advertises it) and WebSocket
+
+Usage: python benchmarks/bench_load.py [--screens 10 100 1000]
+Requires the packages in benchmarks/requirements.txt.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Callable
+import logging
+from pathlib import Path
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any
+
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_test_home_assistant,
+)
+
+from homeassistant import loader
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+
+# Import the integration from this checkout
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from custom_components.roon_now_playing import coordinator as coordinator_module  # noqa: E402
+from custom_components.roon_now_playing.const import (  # noqa: E402
+    CONF_HOST,
+    CONF_PUSH_TRANSPORT,
+    DOMAIN,
+    PUSH_TRANSPORT_REST,
+    PUSH_TRANSPORT_WEBSOCKET,
+)
+from custom_components.roon_now_playing import (  # noqa: E402, F401
+    binary_sensor,
+    select,
+)
+from fake_server import FakeServer, next_layout  # noqa: E402
+
+ENTITIES_PER_SCREEN = 5  # four selects and one binary sensor
+WAIT_TIMEOUT = 120  # seconds
+
+
+async def _wait_for(condition: Callable[[], bool], timeout: float = WAIT_TIMEOUT) -> None:
+    """Poll until a condition holds."""
+    async with asyncio.timeout(timeout):
+        while not condition():
+            await asyncio.sleep(0.001)
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    """Return a percentile of the samples (nearest rank)."""
+    if not samples:
+        return float("nan")
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))]
+
+
+class Bench:
+    """One fleet size: a Home Assistant instance, entry and fake server."""
+
+    def __init__(self, hass: HomeAssistant, server: FakeServer) -> None:
+        """Initialize the benchmark."""
+        self.hass = hass
+        self.server = server
+        self.entry: MockConfigEntry | None = None
+        # layout select entity_id -> friendly name
+        self._layout_entities: dict[str, str] = {}
+        self.latencies: list[float] = []
+        self.state_writes = 0
+
+    @property
+    def coordinator(self) -> coordinator_module.RoonNowPlayingCoordinator:
+        """Return the entry's coordinator."""
+        return self.hass.data[DOMAIN][self.entry.entry_id]
+
+    def _entity_count(self) -> int:
+        """Return the number of integration entities in the state machine."""
+        return len(self.hass.states.async_entity_ids(("select", "binary_sensor")))
+
+    def _settled(self) -> bool:
+        """Return True once every server frame has been applied and published."""
+        coordinator = self.coordinator
+        return (
+            coordinator.sequence.last == self.server.last_seq
+            and coordinator.inbound.depth == 0
+            and coordinator._publish_handle is None  # noqa: SLF001
+        )
+
+    def _consistent(self) -> bool:
+        """Return True once every client matches the server."""
+        if not self._settled():
+            return False
+        for client in self.server.clients.values():
+            state = self.coordinator.get_client(client["friendlyName"])
+            if state is None or state.layout != client["layout"]:
+                return False
+        return True
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Record state writes and the latency of layout changes."""
+        self.state_writes += 1
+        friendly_name = self._layout_entities.get(event.data["entity_id"])
+        if friendly_name and (sent := self.server.sent_at.pop(friendly_name, None)):
+            self.latencies.append(time.perf_counter() - sent)
+
+    async def async_setup(self, url: str, screens: int) -> dict[str, float]:
+        """Set up the entry and measure time and memory until entities exist.
+
+        Platform modules are imported up front so memory per screen excludes
+        import costs; other one-time setup costs amortize at larger fleets.
+        """
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        started = time.perf_counter()
+        self.entry = MockConfigEntry(
+            domain=DOMAIN,
+            title="Roon Now Playing",
+            data={CONF_HOST: url},
+            options={CONF_PUSH_TRANSPORT: PUSH_TRANSPORT_REST},
+        )
+        self.entry.add_to_hass(self.hass)
+        assert await self.hass.config_entries.async_setup(self.entry.entry_id)
+        await self.hass.async_block_till_done()
+        await _wait_for(lambda: self._entity_count() >= screens * ENTITIES_PER_SCREEN)
+        elapsed = time.perf_counter() - started
+        memory = tracemalloc.get_traced_memory()[0] - baseline
+        tracemalloc.stop()
+
+        device_registry = dr.async_get(self.hass)
+        for entity in er.async_entries_for_config_entry(
+            er.async_get(self.hass), self.entry.entry_id
+        ):
+            if entity.unique_id.endswith("_layout") and entity.device_id:
+                device = device_registry.async_get(entity.device_id)
+                for domain, friendly_name in device.identifiers:
+                    if domain == DOMAIN:
+                        self._layout_entities[entity.entity_id] = friendly_name
+        self.hass.bus.async_listen(EVENT_STATE_CHANGED, self._async_state_changed)
+        return {"seconds": elapsed, "kib_per_screen": memory / screens / 1024}
+
+    async def async_updates(self, count: int) -> dict[str, float]:
+        """Send client updates round-robin and measure throughput and latency."""
+        self.latencies.clear()
+        self.server.sent_at.clear()
+        client_ids = list(self.server.clients)
+        queue = self.coordinator.inbound
+        dropped = queue.dropped
+        started = time.perf_counter()
+        for index in range(count):
+            client_id = client_ids[index % len(client_ids)]
+            layout = next_layout(self.server.clients[client_id]["layout"])
+            await self.server.update_client(client_id, layout=layout)
+        await _wait_for(self._consistent)
+        elapsed = time.perf_counter() - started
+        return {
+            "msgs_per_sec": count / elapsed,
+            "p50_ms": _percentile(self.latencies, 50) * 1000,
+            "p95_ms": _percentile(self.latencies, 95) * 1000,
+            "p99_ms": _percentile(self.latencies, 99) * 1000,
+            "dropped": queue.dropped - dropped,
+            "max_depth": queue.max_depth,
+        }
+
+    async def async_reconnect_storm(self, drops: int) -> dict[str, float]:
+        """Drop the connection repeatedly and measure recovery."""
+        recoveries: list[float] = []
+        writes = self.state_writes
+        for _ in range(drops):
+            started = time.perf_counter()
+            await self.server.drop_connections()
+            await _wait_for(lambda: self.server.connections == 1 and self._settled())
+            recoveries.append(time.perf_counter() - started)
+        return {
+            "mean_ms": statistics.fmean(recoveries) * 1000,
+            "max_ms": max(recoveries) * 1000,
+            "writes_per_reconnect": (self.state_writes - writes) / drops,
+        }
+
+    async def async_bulk_push(self, transport: str, concurrency: int) -> dict[str, float]:
+        """Apply a profile to every screen and measure push throughput."""
+        if self.entry.options.get(CONF_PUSH_TRANSPORT) != transport:
+            # Changing options reloads the entry
+            self.hass.config_entries.async_update_entry(
+                self.entry, options={CONF_PUSH_TRANSPORT: transport}
+            )
+            await self.hass.async_block_till_done()
+            await _wait_for(lambda: self.coordinator.ready and self._settled())
+
+        screens = [client["friendlyName"] for client in self.server.clients.values()]
+        layout = next_layout(self.server.clients["client-0"]["layout"])
+        started = time.perf_counter()
+        response: dict[str, Any] = await self.hass.services.async_call(
+            DOMAIN,
+            "apply_profile",
+            {"screens": screens, "layout": layout, "max_concurrency": concurrency},
+            blocking=True,
+            return_response=True,
+        )
+        elapsed = time.perf_counter() - started
+        return {
+            "pushes_per_sec": len(screens) / elapsed,
+            "failed": response["failed"],
+        }
+
+
+async def run(screens: int, args: argparse.Namespace) -> None:
+    """Run every scenario for one fleet size."""
+    server = FakeServer(screens)
+    url = await server.start()
+    with tempfile.TemporaryDirectory() as config_dir:
+        async with async_test_home_assistant(config_dir=config_dir) as hass:
+            # Allow loading the integration from custom_components
+            hass.data.pop(loader.DATA_CUSTOM_COMPONENTS, None)
+            bench = Bench(hass, server)
+            print(f"{screens} screens")
+            setup = await bench.async_setup(url, screens)
+            print(
+                f"  setup        {setup['seconds'] * 1000:9.1f} ms"
+                f"  {setup['kib_per_screen']:7.1f} KiB/screen"
+            )
+            updates = await bench.async_updates(args.updates)
+            print(
+                f"  updates      {updates['msgs_per_sec']:9.0f} msgs/s"
+                f"  p50 {updates['p50_ms']:.2f} ms  p95 {updates['p95_ms']:.2f} ms"
+                f"  p99 {updates['p99_ms']:.2f} ms"
+                f"  dropped {updates['dropped']}  max depth {updates['max_depth']}"
+            )
+            storm = await bench.async_reconnect_storm(args.reconnects)
+            print(
+                f"  reconnects   {storm['mean_ms']:9.1f} ms mean"
+                f"  {storm['max_ms']:.1f} ms max"
+                f"  {storm['writes_per_reconnect']:.1f} state writes/reconnect"
+            )
+            for transport in (PUSH_TRANSPORT_REST, PUSH_TRANSPORT_WEBSOCKET):
+                push = await bench.async_bulk_push(transport, args.concurrency)
+                print(
+                    f"  push {transport:<9} {push['pushes_per_sec']:7.0f} pushes/s"
+                    f"  failed {push['failed']}"
+                )
+            await hass.config_entries.async_unload(bench.entry.entry_id)
+            await hass.async_block_till_done()
+    await server.stop()
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--screens", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--updates", type=int, default=5000)
+    parser.add_argument("--reconnects", type=int, default=10)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    # Reconnect immediately so the storm measures resync cost, not backoff
+    coordinator_module.RECONNECT_BASE_DELAY = 0.001
+    for screens in args.screens:
+        asyncio.run(run(screens, args))
+
+
+if __name__ == "__main__":
+    main()
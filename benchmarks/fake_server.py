@@ -0,0 +1,310 @@
+"""Local stand-in for the Roon Now Playing server.
+
+Implements the parts of the server the integration talks to: the health
+check and capabilities, the admin WebSocket (clients_list, zones, client
+updates, playback frames, WebSocket pushes and resync requests), the REST
+and bulk push endpoints and album art. It can be run on its own to point a
+development Home Assistant at, or driven in-process by bench_load.py.
+
+Usage: python benchmarks/fake_server.py [--port 3000] [--screens 10]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import time
+from typing import Any
+
+from aiohttp import WSMsgType, web
+
+LAYOUTS = ("detailed", "minimal", "fullscreen", "ambient", "cover", "basic")
+FONTS = ("system", "inter", "roboto", "lato")
+BACKGROUNDS = ("black", "white", "dominant", "gradient-radial")
+VERSION = "1.6.0"
+FEATURES = ("ws_push", "bulk_push", "ws_compression")
+
+
+def next_layout(layout: str) -> str:
+    """Return a layout different from the given one."""
+    return LAYOUTS[(LAYOUTS.index(layout) + 1) % len(LAYOUTS)]
+
+
+class FakeServer:
+    """Admin API of a server with a configurable fleet of screens."""
+
+    def __init__(
+        self,
+        screens: int = 10,
+        zones: int = 8,
+        version: str = VERSION,
+        features: tuple[str, ...] | None = FEATURES,
+    ) -> None:
+        """Initialize the server state.
+
+        With features None the server predates capability negotiation.
+        """
+        self.version = version
+        self.features = features
+        self.zones = [
+            {"id": f"zone-{index}", "display_name": f"Zone {index}"}
+            for index in range(zones)
+        ]
+        self.clients: dict[str, dict[str, Any]] = {}
+        for index in range(screens):
+            self.add_screen(index)
+        self._sockets: set[web.WebSocketResponse] = set()
+        self._seq = itertools.count(1)
+        self.last_seq = 0
+        self._runner: web.AppRunner | None = None
+        # friendlyName -> perf_counter() of the oldest update not yet observed
+        self.sent_at: dict[str, float] = {}
+        self.frames_sent = 0
+        self.rest_pushes = 0
+        self.bulk_pushes = 0
+        self.capability_requests = 0
+        self.ws_pushes = 0
+        self.resyncs = 0
+        self.image_requests = 0
+        self.image_not_modified = 0
+
+    def add_screen(self, index: int) -> dict[str, Any]:
+        """Add a connected screen."""
+        zone = self.zones[index % len(self.zones)]
+        client = {
+            "clientId": f"client-{index}",
+            "friendlyName": f"Screen {index}",
+            "layout": LAYOUTS[index % len(LAYOUTS)],
+            "font": FONTS[index % len(FONTS)],
+            "background": BACKGROUNDS[index % len(BACKGROUNDS)],
+            "zoneId": zone["id"],
+            "zoneName": zone["display_name"],
+            "userAgent": "Mozilla/5.0 (X11; Linux armv7l)",
+            "connectedAt": "2025-02-02T10:00:00.000Z",
+        }
+        self.clients[client["clientId"]] = client
+        return client
+
+    @property
+    def connections(self) -> int:
+        """Return the number of open admin WebSockets."""
+        return len(self._sockets)
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving and return the base URL."""
+        app = web.Application()
+        app.router.add_get("/api/health", self._handle_health)
+        app.router.add_get("/ws", self._handle_ws)
+        app.router.add_get("/api/capabilities", self._handle_capabilities)
+        app.router.add_post("/api/admin/clients/push", self._handle_bulk_push)
+        app.router.add_post("/api/admin/clients/{client_id}/push", self._handle_push)
+        app.router.add_get("/api/image/{image_key}", self._handle_image)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_port = site._server.sockets[0].getsockname()[1]  # noqa: SLF001
+        return f"http://{host}:{bound_port}"
+
+    async def stop(self) -> None:
+        """Close all sockets and stop serving."""
+        await self.drop_connections()
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def drop_connections(self) -> None:
+        """Close every admin WebSocket (a server restart as seen by clients)."""
+        await asyncio.gather(*(ws.close() for ws in list(self._sockets)))
+
+    async def update_client(self, client_id: str, **settings: str) -> None:
+        """Change a client's settings and broadcast client_updated."""
+        client = self.clients[client_id]
+        client.update(settings)
+        self.sent_at.setdefault(client["friendlyName"], time.perf_counter())
+        await self._broadcast({"type": "client_updated", "client": client})
+
+    async def play(
+        self, zone_id: str, state: str = "playing", position: int = 0, track: int = 0
+    ) -> None:
+        """Broadcast now_playing for a zone."""
+        await self._broadcast(
+            {
+                "type": "now_playing",
+                "zoneId": zone_id,
+                "state": state,
+                "seek_position": position,
+                "track": {
+                    "title": f"Track {track}",
+                    "artist": "Artist",
+                    "album": "Album",
+                    "duration": 240,
+                    "image_key": f"image-{track}",
+                },
+            }
+        )
+
+    async def tick(self, zone_id: str, position: int) -> None:
+        """Broadcast a playback progress tick for a zone."""
+        await self._broadcast(
+            {"type": "seek_position", "zoneId": zone_id, "seek_position": position}
+        )
+
+    async def _broadcast(self, message: dict[str, Any]) -> None:
+        """Send a message to every admin WebSocket."""
+        for ws in list(self._sockets):
+            await self._send(ws, message)
+
+    async def _send(self, ws: web.WebSocketResponse, message: dict[str, Any]) -> None:
+        """Send a message with the next sequence number."""
+        if ws.closed:
+            return
+        self.last_seq = next(self._seq)
+        # The type goes first, as on the real server
+        await ws.send_json({**message, "seq": self.last_seq})
+        self.frames_sent += 1
+
+    async def _send_clients_list(self, ws: web.WebSocketResponse) -> None:
+        """Send the full client list."""
+        await self._send(
+            ws, {"type": "clients_list", "clients": list(self.clients.values())}
+        )
+
+    def _apply(self, client_id: str, settings: dict[str, Any]) -> dict[str, Any] | None:
+        """Apply pushed settings to a client."""
+        if (client := self.clients.get(client_id)) is None:
+            return None
+        client.update(
+            (key, value)
+            for key, value in settings.items()
+            if key in ("layout", "font", "background", "zoneId")
+        )
+        if "zoneId" in settings:
+            for zone in self.zones:
+                if zone["id"] == settings["zoneId"]:
+                    client["zoneName"] = zone["display_name"]
+        return client
+
+    async def _handle_health(self, request: web.Request) -> web.Response:
+        """Health check, carrying the version the integration caches on."""
+        return web.json_response({"status": "ok", "version": self.version})
+
+    async def _handle_capabilities(self, request: web.Request) -> web.Response:
+        """Features and option lists of this server version."""
+        if self.features is None:
+            raise web.HTTPNotFound
+        self.capability_requests += 1
+        return web.json_response(
+            {
+                "version": self.version,
+                "features": list(self.features),
+                "layouts": list(LAYOUTS),
+                "fonts": list(FONTS),
+                "backgrounds": list(BACKGROUNDS),
+            }
+        )
+
+    async def _handle_image(self, request: web.Request) -> web.Response:
+        """Album art, with ETag revalidation."""
+        self.image_requests += 1
+        image_key = request.match_info["image_key"]
+        etag = f'"{image_key}-{request.query.get("width", "0")}"'
+        if request.headers.get("If-None-Match") == etag:
+            self.image_not_modified += 1
+            return web.Response(status=304, headers={"ETag": etag})
+        # Roughly the size of a 600px JPEG
+        body = image_key.encode().ljust(60_000, b"\0")
+        return web.Response(
+            body=body, content_type="image/jpeg", headers={"ETag": etag}
+        )
+
+    async def _handle_push(self, request: web.Request) -> web.Response:
+        """REST push of settings to one client."""
+        client = self._apply(request.match_info["client_id"], await request.json())
+        if client is None:
+            return web.json_response({"error": "Client not found"}, status=404)
+        self.rest_pushes += 1
+        await self._broadcast({"type": "client_updated", "client": client})
+        return web.json_response({"success": True})
+
+    async def _handle_bulk_push(self, request: web.Request) -> web.Response:
+        """REST push of settings to several clients."""
+        if self.features is None or "bulk_push" not in self.features:
+            raise web.HTTPNotFound
+        self.bulk_pushes += 1
+        results: dict[str, bool] = {}
+        updated: list[dict[str, Any]] = []
+        for push in (await request.json()).get("clients", []):
+            client = self._apply(push.get("clientId", ""), push.get("settings", {}))
+            results[push.get("clientId", "")] = client is not None
+            if client is not None:
+                self.rest_pushes += 1
+                updated.append(client)
+        for client in updated:
+            await self._broadcast({"type": "client_updated", "client": client})
+        return web.json_response({"results": results})
+
+    async def _handle_ws(self, request: web.Request) -> web.WebSocketResponse:
+        """Admin WebSocket."""
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self._sockets.add(ws)
+        try:
+            await self._send(ws, {"type": "zones", "zones": self.zones})
+            await self._send_clients_list(ws)
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    continue
+                await self._handle_ws_message(ws, msg.json())
+        finally:
+            self._sockets.discard(ws)
+        return ws
+
+    async def _handle_ws_message(
+        self, ws: web.WebSocketResponse, data: dict[str, Any]
+    ) -> None:
+        """Handle a message sent by the integration."""
+        if data.get("type") == "resync":
+            self.resyncs += 1
+            await self._send_clients_list(ws)
+        elif data.get("type") == "push_settings":
+            client = self._apply(data.get("clientId", ""), data.get("settings", {}))
+            self.ws_pushes += 1
+            await self._send(
+                ws,
+                {
+                    "type": "push_ack",
+                    "requestId": data.get("requestId"),
+                    "success": client is not None,
+                },
+            )
+            if client is not None:
+                await self._broadcast({"type": "client_updated", "client": client})
+
+
+async def _serve(host: str, port: int, screens: int) -> None:
+    """Serve until interrupted."""
+    server = FakeServer(screens)
+    url = await server.start(host, port)
+    print(f"Serving {screens} screens at {url}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+def main() -> None:
+    """Run the server standalone."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=3000)
+    parser.add_argument("--screens", type=int, default=10)
+    args = parser.parse_args()
+    try:
+        asyncio.run(_serve(args.host, args.port, args.screens))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -2,33 +2,67 @@
 from __future__ import annotations
 
 import logging
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN, PLATFORMS
+from .const import DOMAIN, PLATFORMS, STORAGE_KEY, STORAGE_VERSION
 from .coordinator import RoonNowPlayingCoordinator
+from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+READY_TIMEOUT = 10  # seconds
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Roon Now Playing services."""
+    async_setup_services(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Roon Now Playing from a config entry."""
     coordinator = RoonNowPlayingCoordinator(hass, entry)
 
-    # Start WebSocket connection
+    # Restore last known screens so entities exist before the server answers
+    await coordinator.async_load_snapshot()
+
+    # Connect in the background; platforms add entities as screens appear
     await coordinator.async_start()
 
-    # Wait briefly for initial data
-    await coordinator.async_config_entry_first_refresh()
+    # Without a snapshot there is nothing to show yet: wait a bounded time
+    # for the server and let Home Assistant retry setup if it is unreachable
+    if not coordinator.stale and not await coordinator.async_wait_ready(
+        READY_TIMEOUT
+    ):
+        await coordinator.async_stop()
+        raise ConfigEntryNotReady(f"Timed out connecting to {coordinator.host}")
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry when options change."""
+    coordinator: RoonNowPlayingCoordinator = hass.data[DOMAIN][entry.entry_id]
+    if entry.options == coordinator.options:
+        # Only the cached capabilities changed; the coordinator applied them
+        return
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     coordinator: RoonNowPlayingCoordinator = hass.data[DOMAIN][entry.entry_id]
@@ -40,3 +74,59 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
     return unload_ok
+
+
+async def async_remove_config_entry_device(
+    hass: HomeAssistant, entry: ConfigEntry, device_entry: dr.DeviceEntry
+) -> bool:
+    """Allow removing a screen device that is not connected."""
+    friendly_names = {
+        identifier
+        for domain, identifier in device_entry.identifiers
+        if domain == DOMAIN
+    }
+    if entry.entry_id in friendly_names:
+        # The server device carries the diagnostic sensors
+        return False
+    coordinator: RoonNowPlayingCoordinator | None = hass.data.get(DOMAIN, {}).get(
+        entry.entry_id
+    )
+    if coordinator is None:
+        # Not loaded (e.g. retrying setup): no screen is known to be
+        # connected, and the snapshot must not restore the removed ones
+        await _async_forget_stored_screens(hass, entry, friendly_names)
+        return True
+    for friendly_name in friendly_names:
+        client = coordinator.get_client(friendly_name)
+        if client is not None and client.connected:
+            return False
+    for friendly_name in friendly_names:
+        coordinator.async_forget_screen(friendly_name)
+    return True
+
+
+async def _async_forget_stored_screens(
+    hass: HomeAssistant, entry: ConfigEntry, friendly_names: set[str]
+) -> None:
+    """Drop screens from the snapshot of an entry that is not loaded."""
+    store: Store[dict[str, Any]] = Store(
+        hass, STORAGE_VERSION, STORAGE_KEY.format(entry_id=entry.entry_id)
+    )
+    if not (snapshot := await store.async_load()):
+        return
+    snapshot["clients"] = [
+        client
+        for client in snapshot.get("clients", [])
+        if client.get("friendlyName") not in friendly_names
+    ]
+    last_seen = snapshot.get("last_seen", {})
+    for friendly_name in friendly_names:
+        last_seen.pop(friendly_name, None)
+    await store.async_save(snapshot)
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored snapshot when the entry is deleted."""
+    await Store(
+        hass, STORAGE_VERSION, STORAGE_KEY.format(entry_id=entry.entry_id)
+    ).async_remove()
@@ -0,0 +1,170 @@
+"""Album art cache for Roon Now Playing."""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass
+import logging
+import time
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+_LOGGER = logging.getLogger(__name__)
+
+ARTWORK_URL = "{host}/api/image/{image_key}?width={size}&height={size}"
+ARTWORK_SIZE = 600  # pixels, square
+ARTWORK_MAX_BYTES = 32 * 1024 * 1024
+ARTWORK_MAX_AGE = 3600  # seconds before an entry is revalidated
+ARTWORK_TIMEOUT = 10  # seconds
+
+
+@dataclass(slots=True)
+class CachedImage:
+    """An image and the validators to revalidate it."""
+
+    content: bytes
+    content_type: str
+    etag: str | None
+    last_modified: str | None
+    fetched: float  # monotonic timestamp of the last fetch or revalidation
+
+
+@dataclass
+class ArtworkStats:
+    """Counters of the artwork cache."""
+
+    hits: int = 0
+    misses: int = 0
+    revalidated: int = 0  # stale entries confirmed unchanged (304)
+    deduplicated: int = 0  # requests served by a fetch already in flight
+    errors: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float | None:
+        """Return the share of requests served without downloading."""
+        served = self.hits + self.revalidated + self.deduplicated
+        total = served + self.misses
+        return served / total if total else None
+
+
+class ArtworkCache:
+    """Size-bounded LRU cache of album art keyed by image key and size.
+
+    Stale entries are revalidated with If-None-Match/If-Modified-Since, and
+    concurrent requests for the same image share one download.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        host: str,
+        max_bytes: int = ARTWORK_MAX_BYTES,
+        max_age: float = ARTWORK_MAX_AGE,
+    ) -> None:
+        """Initialize the cache."""
+        self._hass = hass
+        self._host = host
+        self._max_bytes = max_bytes
+        self._max_age = max_age
+        self._entries: OrderedDict[tuple[str, int], CachedImage] = OrderedDict()
+        self._inflight: dict[tuple[str, int], asyncio.Task[CachedImage | None]] = {}
+        self.bytes = 0
+        self.stats = ArtworkStats()
+
+    def __len__(self) -> int:
+        """Return the number of cached images."""
+        return len(self._entries)
+
+    async def async_get(
+        self, image_key: str, size: int = ARTWORK_SIZE
+    ) -> CachedImage | None:
+        """Return an image, downloading or revalidating it when needed."""
+        key = (image_key, size)
+        cached = self._entries.get(key)
+        if cached is not None and time.monotonic() - cached.fetched < self._max_age:
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return cached
+
+        if (task := self._inflight.get(key)) is not None:
+            self.stats.deduplicated += 1
+        else:
+            task = self._inflight[key] = self._hass.async_create_task(
+                self._async_fetch(key, cached)
+            )
+            task.add_done_callback(lambda _task: self._inflight.pop(key, None))
+        # A cancelled caller must not cancel the download other callers share
+        return await asyncio.shield(task)
+
+    async def _async_fetch(
+        self, key: tuple[str, int], cached: CachedImage | None
+    ) -> CachedImage | None:
+        """Download an image, or revalidate a stale cached copy."""
+        image_key, size = key
+        url = ARTWORK_URL.format(host=self._host, image_key=image_key, size=size)
+        headers: dict[str, str] = {}
+        if cached is not None:
+            if cached.etag:
+                headers[aiohttp.hdrs.IF_NONE_MATCH] = cached.etag
+            if cached.last_modified:
+                headers[aiohttp.hdrs.IF_MODIFIED_SINCE] = cached.last_modified
+
+        session = async_get_clientsession(self._hass)
+        try:
+            async with session.get(
+                url,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=ARTWORK_TIMEOUT),
+            ) as response:
+                if response.status == 304 and cached is not None:
+                    await response.read()
+                    cached.fetched = time.monotonic()
+                    if key in self._entries:
+                        self._entries.move_to_end(key)
+                    self.stats.revalidated += 1
+                    return cached
+                content = await response.read()
+                if response.status != 200:
+                    _LOGGER.debug(
+                        "Failed to fetch artwork %s: %s", image_key, response.status
+                    )
+                    self.stats.errors += 1
+                    return cached
+                image = CachedImage(
+                    content=content,
+                    content_type=response.content_type or "image/jpeg",
+                    etag=response.headers.get(aiohttp.hdrs.ETAG),
+                    last_modified=response.headers.get(aiohttp.hdrs.LAST_MODIFIED),
+                    fetched=time.monotonic(),
+                )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            _LOGGER.debug("Error fetching artwork %s: %s", image_key, err)
+            self.stats.errors += 1
+            # Serve the stale copy rather than nothing
+            return cached
+
+        self.stats.misses += 1
+        self._store(key, image)
+        return image
+
+    def _store(self, key: tuple[str, int], image: CachedImage) -> None:
+        """Insert an image, evicting the least recently used beyond the cap."""
+        if (old := self._entries.pop(key, None)) is not None:
+            self.bytes -= len(old.content)
+        if len(image.content) > self._max_bytes:
+            return
+        self._entries[key] = image
+        self.bytes += len(image.content)
+        while self.bytes > self._max_bytes:
+            _key, evicted = self._entries.popitem(last=False)
+            self.bytes -= len(evicted.content)
+            self.stats.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every cached image."""
+        self._entries.clear()
+        self.bytes = 0
@@ -0,0 +1,144 @@
+"""Server version and capability negotiation for Roon Now Playing."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import ipaddress
+import logging
+from typing import Any
+from urllib.parse import urlparse
+
+import aiohttp
+
+from .const import BACKGROUNDS, FONTS, LAYOUTS
+
+_LOGGER = logging.getLogger(__name__)
+
+HEALTH_URL = "{host}/api/health"
+CAPABILITIES_URL = "{host}/api/capabilities"
+NEGOTIATION_TIMEOUT = 10  # seconds
+
+# Features a server may advertise
+FEATURE_WS_PUSH = "ws_push"  # push_settings over the admin WebSocket
+FEATURE_BULK_PUSH = "bulk_push"  # POST /api/admin/clients/push for many clients
+FEATURE_WS_COMPRESSION = "ws_compression"  # permessage-deflate on the WebSocket
+
+# Host names that resolve on the local network
+LOCAL_SUFFIXES = (".local", ".lan", ".home.arpa", ".internal")
+
+
+@dataclass(slots=True, frozen=True)
+class ServerCapabilities:
+    """What a server version supports.
+
+    Features are resolved to booleans up front so checking one on a hot
+    path is an attribute read. Option lists are built once and handed to
+    the select entities as they are.
+    """
+
+    version: str | None = None
+    ws_push: bool = False
+    bulk_push: bool = False
+    ws_compression: bool = False
+    layouts: list[str] = field(default_factory=lambda: list(LAYOUTS))
+    fonts: list[str] = field(default_factory=lambda: list(FONTS))
+    backgrounds: list[str] = field(default_factory=lambda: list(BACKGROUNDS))
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> ServerCapabilities:
+        """Parse capabilities as sent by the server or cached on the entry."""
+        features = payload.get("features")
+        if not isinstance(features, list):
+            features = []
+        features = {feature for feature in features if isinstance(feature, str)}
+        return cls(
+            version=payload.get("version"),
+            ws_push=FEATURE_WS_PUSH in features,
+            bulk_push=FEATURE_BULK_PUSH in features,
+            ws_compression=FEATURE_WS_COMPRESSION in features,
+            layouts=_options(payload.get("layouts"), LAYOUTS),
+            fonts=_options(payload.get("fonts"), FONTS),
+            backgrounds=_options(payload.get("backgrounds"), BACKGROUNDS),
+        )
+
+    def as_payload(self) -> dict[str, Any]:
+        """Return the capabilities in the server's format (cached on the entry)."""
+        return {
+            "version": self.version,
+            "features": [
+                feature
+                for feature, supported in (
+                    (FEATURE_WS_PUSH, self.ws_push),
+                    (FEATURE_BULK_PUSH, self.bulk_push),
+                    (FEATURE_WS_COMPRESSION, self.ws_compression),
+                )
+                if supported
+            ],
+            "layouts": list(self.layouts),
+            "fonts": list(self.fonts),
+            "backgrounds": list(self.backgrounds),
+        }
+
+
+def is_local_host(host: str) -> bool:
+    """Return True if the server is on the local network.
+
+    Compressing frames only pays off over slow links; on a LAN inflating
+    them costs more than the bytes saved.
+    """
+    hostname = urlparse(host).hostname or ""
+    try:
+        address = ipaddress.ip_address(hostname)
+    except ValueError:
+        return "." not in hostname or hostname.endswith(LOCAL_SUFFIXES)
+    return address.is_private or address.is_loopback or address.is_link_local
+
+
+def _options(value: Any, default: list[str]) -> list[str]:
+    """Return a server option list, or the built-in one if missing."""
+    if not isinstance(value, list) or not value:
+        return list(default)
+    return [option for option in value if isinstance(option, str)]
+
+
+async def async_get_version(session: aiohttp.ClientSession, host: str) -> str | None:
+    """Return the server version reported by the health check.
+
+    Raises aiohttp.ClientError or TimeoutError if the server is unreachable.
+    """
+    async with session.get(
+        HEALTH_URL.format(host=host),
+        timeout=aiohttp.ClientTimeout(total=NEGOTIATION_TIMEOUT),
+    ) as response:
+        response.raise_for_status()
+        try:
+            data = await response.json(content_type=None)
+        except ValueError:
+            return None
+    version = data.get("version") if isinstance(data, dict) else None
+    return version if isinstance(version, str) else None
+
+
+async def async_get_capabilities(
+    session: aiohttp.ClientSession, host: str, version: str | None
+) -> ServerCapabilities:
+    """Fetch the capabilities of a server version.
+
+    Servers without the endpoint get the built-in option lists and none of
+    the optional features.
+    """
+    async with session.get(
+        CAPABILITIES_URL.format(host=host),
+        timeout=aiohttp.ClientTimeout(total=NEGOTIATION_TIMEOUT),
+    ) as response:
+        if response.status == 404:
+            await response.read()
+            _LOGGER.debug("Server %s does not advertise capabilities", host)
+            return ServerCapabilities(version=version)
+        response.raise_for_status()
+        try:
+            data = await response.json(content_type=None)
+        except ValueError:
+            data = None
+    if not isinstance(data, dict):
+        return ServerCapabilities(version=version)
+    return ServerCapabilities.from_payload({**data, "version": version})
@@ -7,11 +7,37 @@ from typing import Any
 import aiohttp
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
 from homeassistant.const import CONF_HOST
+from homeassistant.core import callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.selector import (
+    SelectSelector,
+    SelectSelectorConfig,
+    SelectSelectorMode,
+)
 
-from .const import DOMAIN
+from .capabilities import (
+    ServerCapabilities,
+    async_get_capabilities,
+    async_get_version,
+)
+from .const import (
+    CONF_CAPABILITIES,
+    CONF_COALESCE_WINDOW,
+    CONF_PUSH_TRANSPORT,
+    CONF_RETENTION_DAYS,
+    DEFAULT_COALESCE_WINDOW,
+    DEFAULT_PUSH_TRANSPORT,
+    DEFAULT_RETENTION_DAYS,
+    DOMAIN,
+    PUSH_TRANSPORTS,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,6 +53,12 @@ class RoonNowPlayingConfigFlow(ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Get the options flow for this handler."""
+        return RoonNowPlayingOptionsFlow(config_entry)
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -40,9 +72,9 @@ class RoonNowPlayingConfigFlow(ConfigFlow, domain=DOMAIN):
             await self.async_set_unique_id(host)
             self._abort_if_unique_id_configured()
 
-            # Test connection
+            # Test connection and learn what the server supports
             try:
-                await self._test_connection(host)
+                capabilities = await self._test_connection(host)
             except CannotConnect:
                 errors["base"] = "cannot_connect"
             except Exception:  # pylint: disable=broad-except
@@ -51,7 +83,10 @@ class RoonNowPlayingConfigFlow(ConfigFlow, domain=DOMAIN):
             else:
                 return self.async_create_entry(
                     title="Roon Now Playing",
-                    data={CONF_HOST: host},
+                    data={
+                        CONF_HOST: host,
+                        CONF_CAPABILITIES: capabilities.as_payload(),
+                    },
                 )
 
         return self.async_show_form(
@@ -60,18 +95,63 @@ class RoonNowPlayingConfigFlow(ConfigFlow, domain=DOMAIN):
             errors=errors,
         )
 
-    async def _test_connection(self, host: str) -> None:
-        """Test if we can connect to the server."""
+    async def _test_connection(self, host: str) -> ServerCapabilities:
+        """Test if we can connect to the server and fetch its capabilities."""
         session = async_get_clientsession(self.hass)
         try:
-            async with session.get(
-                f"{host}/api/health", timeout=aiohttp.ClientTimeout(total=10)
-            ) as response:
-                if response.status != 200:
-                    raise CannotConnect
+            version = await async_get_version(session, host)
+            return await async_get_capabilities(session, host, version)
         except (aiohttp.ClientError, TimeoutError) as err:
             raise CannotConnect from err
 
 
+class RoonNowPlayingOptionsFlow(OptionsFlow):
+    """Handle options for Roon Now Playing."""
+
+    def __init__(self, config_entry: ConfigEntry) -> None:
+        """Initialize options flow."""
+        self._entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self._entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_COALESCE_WINDOW,
+                        default=options.get(
+                            CONF_COALESCE_WINDOW, DEFAULT_COALESCE_WINDOW
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=1000)),
+                    vol.Optional(
+                        CONF_PUSH_TRANSPORT,
+                        default=options.get(
+                            CONF_PUSH_TRANSPORT, DEFAULT_PUSH_TRANSPORT
+                        ),
+                    ): SelectSelector(
+                        SelectSelectorConfig(
+                            options=PUSH_TRANSPORTS,
+                            mode=SelectSelectorMode.DROPDOWN,
+                            translation_key=CONF_PUSH_TRANSPORT,
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_RETENTION_DAYS,
+                        default=options.get(
+                            CONF_RETENTION_DAYS, DEFAULT_RETENTION_DAYS
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=365)),
+                }
+            ),
+        )
+
+
 class CannotConnect(Exception):
     """Error to indicate we cannot connect."""
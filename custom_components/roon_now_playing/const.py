@@ -4,15 +4,45 @@ from typing import Final
 DOMAIN: Final = "roon_now_playing"
 
 # Platforms
-PLATFORMS: Final = ["select", "binary_sensor"]
+PLATFORMS: Final = ["select", "binary_sensor", "sensor", "media_player", "image"]
+
+# Events
+EVENT_CLIENT_CONNECTED: Final = "roon_now_playing_client_connected"
+EVENT_CLIENT_DISCONNECTED: Final = "roon_now_playing_client_disconnected"
+EVENT_SETTINGS_CHANGED: Final = "roon_now_playing_settings_changed"
+EVENT_TRACK_CHANGED: Final = "roon_now_playing_track_changed"
+
+# Storage
+STORAGE_VERSION: Final = 1
+STORAGE_KEY: Final = "roon_now_playing.{entry_id}"
 
 # Configuration
 CONF_HOST: Final = "host"
+CONF_CAPABILITIES: Final = "capabilities"  # cached per server version
+
+# Options
+CONF_COALESCE_WINDOW: Final = "coalesce_window"
+CONF_PUSH_TRANSPORT: Final = "push_transport"
+CONF_RETENTION_DAYS: Final = "retention_days"
+
+# Push transports
+PUSH_TRANSPORT_AUTO: Final = "auto"  # WebSocket if the server supports it
+PUSH_TRANSPORT_REST: Final = "rest"
+PUSH_TRANSPORT_WEBSOCKET: Final = "websocket"
+PUSH_TRANSPORTS: Final = [
+    PUSH_TRANSPORT_AUTO,
+    PUSH_TRANSPORT_REST,
+    PUSH_TRANSPORT_WEBSOCKET,
+]
 
 # Defaults
 DEFAULT_PORT: Final = 3000
+DEFAULT_COALESCE_WINDOW: Final = 10  # milliseconds, 0 = one event loop tick
+DEFAULT_PUSH_TRANSPORT: Final = PUSH_TRANSPORT_AUTO
+DEFAULT_RETENTION_DAYS: Final = 30
 
-# Options for select entities (mirrored from roon-now-playing server)
+# Options for select entities (mirrored from roon-now-playing server), used
+# unless the server advertises its own lists
 LAYOUTS: Final = [
     "detailed",
     "minimal",
@@ -2,7 +2,14 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable, Iterable, ValuesView
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta
+from functools import partial
+import itertools
 import logging
+import random
+import time
 from typing import Any
 from urllib.parse import urlparse
 
@@ -10,18 +17,382 @@ import aiohttp
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN
+from .const import (
+    CONF_CAPABILITIES,
+    CONF_COALESCE_WINDOW,
+    CONF_PUSH_TRANSPORT,
+    CONF_RETENTION_DAYS,
+    DEFAULT_COALESCE_WINDOW,
+    DEFAULT_PUSH_TRANSPORT,
+    DEFAULT_RETENTION_DAYS,
+    DOMAIN,
+    EVENT_CLIENT_CONNECTED,
+    EVENT_CLIENT_DISCONNECTED,
+    EVENT_SETTINGS_CHANGED,
+    EVENT_TRACK_CHANGED,
+    PUSH_TRANSPORT_AUTO,
+    PUSH_TRANSPORT_WEBSOCKET,
+    STORAGE_KEY,
+    STORAGE_VERSION,
+)
+from .artwork import ArtworkCache
+from .capabilities import (
+    ServerCapabilities,
+    async_get_capabilities,
+    async_get_version,
+    is_local_host,
+)
+from .events import UNKNOWN, EventFilter
+from .metrics import (
+    TRACE_INBOUND,
+    TRACE_OUTBOUND,
+    CoordinatorMetrics,
+    TraceBuffer,
+)
+from .models import ClientState, NowPlaying, ZoneState
+from .protocol import (
+    InboundQueue,
+    SequenceTracker,
+    get_json_loads,
+    sniff_seq,
+    sniff_type,
+)
+from .push import ClientPushQueue
 
 _LOGGER = logging.getLogger(__name__)
 
-RECONNECT_INTERVAL = 5  # seconds
+RECONNECT_BASE_DELAY = 1  # seconds, doubled per failed attempt
+RECONNECT_MAX_DELAY = 60  # seconds
+STABLE_CONNECTION = 60  # seconds up before the backoff resets
+HEARTBEAT_INTERVAL = 15  # seconds between pings
+PONG_TIMEOUT = 10  # seconds to wait for a pong before reconnecting
+PUSH_TIMEOUT = 10  # seconds
+WS_ACK_TIMEOUT = 2  # seconds
+BULK_PUSH_MAX = 100  # clients per bulk push request
+WS_COMPRESSION = 15  # deflate window bits for remote servers supporting it
+OPTIMISTIC_TIMEOUT = 10  # seconds
+SNAPSHOT_SAVE_DELAY = 10  # seconds
+EVICTION_INTERVAL = timedelta(minutes=10)
+CLIENT_TTL = 24 * 3600  # seconds a disconnected client is kept
+MAX_DISCONNECTED_CLIENTS = 200
+INBOUND_QUEUE_SIZE = 1000  # messages read but not yet applied
+HANDLER_BATCH = 64  # messages applied before yielding to the event loop
+SEEK_TOLERANCE = 2  # seconds a progress tick may drift before it counts as a seek
+# Screen settings compared for settings_changed events
+EVENT_SETTINGS = ("layout", "font", "background", "zone_id")
+# Sent when a sequence gap shows frames were missed; answered with clients_list
+RESYNC_REQUEST = {"type": "resync"}
 
+# Select key -> ClientState attribute confirming an optimistic value
+OPTIMISTIC_FIELDS = {
+    "layout": "layout",
+    "font": "font",
+    "background": "background",
+    "zone": "zone_name",
+}
 
-class RoonNowPlayingCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+
+def backoff_delay(attempt: int) -> float:
+    """Return the delay before a reconnect attempt.
+
+    The first retry is immediate; later ones back off exponentially with
+    jitter so many clients do not reconnect to one server in lockstep.
+    """
+    if attempt <= 0:
+        return 0
+    ceiling = min(RECONNECT_MAX_DELAY, RECONNECT_BASE_DELAY * 2 ** (attempt - 1))
+    return random.uniform(ceiling / 2, ceiling)
+
+
+@dataclass
+class ConnectionStats:
+    """Health of the WebSocket connection."""
+
+    reconnects: int = 0
+    missed_pongs: int = 0
+    resyncs: int = 0
+    latency: float | None = None  # seconds, last ping round-trip
+    connected_since: float | None = None  # monotonic timestamp
+    connected_at: datetime | None = None  # wall clock, for display
+
+    @property
+    def uptime(self) -> float | None:
+        """Return how long the current connection has been up."""
+        if self.connected_since is None:
+            return None
+        return time.monotonic() - self.connected_since
+
+
+@dataclass
+class CoalesceStats:
+    """Counters for messages folded into coalesced publishes."""
+
+    publishes: int = 0
+    messages: int = 0
+    last_batch: int = 0
+    max_batch: int = 0
+
+    @property
+    def messages_per_publish(self) -> float:
+        """Return the average number of messages per publish."""
+        return self.messages / self.publishes if self.publishes else 0.0
+
+    def record(self, batch: int) -> None:
+        """Record a publish of the given number of messages."""
+        self.publishes += 1
+        self.messages += batch
+        self.last_batch = batch
+        self.max_batch = max(self.max_batch, batch)
+
+
+@dataclass(slots=True)
+class ClientsDiff:
+    """ClientIds changed by a clients_list, and the friendly names touched."""
+
+    added: set[str] = field(default_factory=set)
+    removed: set[str] = field(default_factory=set)
+    changed: set[str] = field(default_factory=set)
+    touched: set[str] = field(default_factory=set)
+
+
+class ClientRegistry:
+    """Clients keyed by clientId with a friendlyName index.
+
+    The index maps each friendly name to its preferred client (the first
+    connected one, otherwise the first one seen) so entities can resolve
+    their client in constant time.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._clients: dict[str, ClientState] = {}
+        # friendlyName -> clientIds carrying that name, in insertion order
+        self._members: dict[str, dict[str, None]] = {}
+        # friendlyName -> preferred client
+        self._preferred: dict[str, ClientState] = {}
+        # clientId -> monotonic time it disconnected, oldest first
+        self._disconnected_at: dict[str, float] = {}
+
+    def __len__(self) -> int:
+        """Return the number of tracked clients."""
+        return len(self._clients)
+
+    def __contains__(self, client_id: object) -> bool:
+        """Return True if the clientId is tracked."""
+        return client_id in self._clients
+
+    def get(self, client_id: str) -> ClientState | None:
+        """Return a client by clientId."""
+        return self._clients.get(client_id)
+
+    def get_by_name(self, friendly_name: str) -> ClientState | None:
+        """Return the preferred client for a friendly name."""
+        return self._preferred.get(friendly_name)
+
+    def values(self) -> ValuesView[ClientState]:
+        """Return all tracked clients."""
+        return self._clients.values()
+
+    def named(self) -> dict[str, ClientState]:
+        """Return the preferred client for every friendly name."""
+        return self._preferred
+
+    def replace(self, clients: Iterable[ClientState]) -> None:
+        """Replace all clients (full refresh)."""
+        self._clients = {}
+        self._members = {}
+        self._preferred = {}
+        self._disconnected_at = {}
+        for client in clients:
+            self.upsert(client)
+
+    def reconcile(self, clients: Iterable[ClientState]) -> ClientsDiff:
+        """Apply a full client list, touching only what changed.
+
+        Clients missing from the list are marked disconnected rather than
+        dropped, so their screens keep their last known settings.
+        """
+        diff = ClientsDiff()
+        seen: set[str] = set()
+        for client in clients:
+            seen.add(client.client_id)
+            old = self._clients.get(client.client_id)
+            if old == client:
+                continue
+            if old is None:
+                diff.added.add(client.client_id)
+                if client.connected and client.friendly_name:
+                    # Same cleanup as a client_connected message
+                    self.remove_disconnected(client.friendly_name)
+            else:
+                diff.changed.add(client.client_id)
+            diff.touched |= self.upsert(client)
+        for client_id, client in self._clients.items():
+            if client_id in seen or not client.connected:
+                continue
+            self.mark_disconnected(client_id)
+            diff.removed.add(client_id)
+            if client.friendly_name:
+                diff.touched.add(client.friendly_name)
+        return diff
+
+    def upsert(self, client: ClientState) -> set[str]:
+        """Insert or replace a client, returning the friendly names it touched."""
+        client_id = client.client_id
+        old = self._clients.get(client_id)
+        old_name = old.friendly_name if old else None
+        new_name = client.friendly_name
+
+        self._clients[client_id] = client
+        if not client.connected:
+            self._disconnected_at.setdefault(client_id, time.monotonic())
+        else:
+            self._disconnected_at.pop(client_id, None)
+        touched: set[str] = set()
+        if old_name and old_name != new_name:
+            self._unlink(old_name, client_id)
+            touched.add(old_name)
+        if new_name:
+            self._members.setdefault(new_name, {})[client_id] = None
+            self._reindex(new_name)
+            touched.add(new_name)
+        return touched
+
+    def mark_disconnected(self, client_id: str) -> ClientState | None:
+        """Flag a client as disconnected, keeping it for entity updates."""
+        client = self._clients.get(client_id)
+        if client is None:
+            return None
+        client.connected = False
+        self._disconnected_at.setdefault(client_id, time.monotonic())
+        if client.friendly_name:
+            self._reindex(client.friendly_name)
+        return client
+
+    def remove(self, client_id: str) -> ClientState | None:
+        """Remove a client."""
+        client = self._clients.pop(client_id, None)
+        self._disconnected_at.pop(client_id, None)
+        if client and (friendly_name := client.friendly_name):
+            self._unlink(friendly_name, client_id)
+        return client
+
+    def remove_disconnected(self, friendly_name: str) -> None:
+        """Remove disconnected clients carrying a friendly name."""
+        stale = [
+            client_id
+            for client_id in self._members.get(friendly_name, ())
+            if not self._clients[client_id].connected
+        ]
+        for client_id in stale:
+            self.remove(client_id)
+
+    def remove_name(self, friendly_name: str) -> None:
+        """Remove every client carrying a friendly name."""
+        for client_id in list(self._members.get(friendly_name, ())):
+            self.remove(client_id)
+
+    def evict(self, ttl: float, max_disconnected: int) -> set[str]:
+        """Drop disconnected clients, returning the friendly names touched.
+
+        Disconnected clients older than the TTL are removed unless they are
+        the only record left for a named screen; beyond that, the oldest
+        disconnected clients are removed until at most max_disconnected
+        remain.
+        """
+        touched: set[str] = set()
+        expire_before = time.monotonic() - ttl
+        for client_id, disconnected_at in list(self._disconnected_at.items()):
+            if disconnected_at > expire_before:
+                break
+            friendly_name = self._clients[client_id].friendly_name
+            if friendly_name and self._preferred[friendly_name] is self._clients[client_id]:
+                # Keep the screen's last known state until it is retired
+                continue
+            self.remove(client_id)
+            if friendly_name:
+                touched.add(friendly_name)
+
+        overflow = len(self._disconnected_at) - max_disconnected
+        for client_id in list(self._disconnected_at)[: max(overflow, 0)]:
+            if client := self.remove(client_id):
+                if client.friendly_name:
+                    touched.add(client.friendly_name)
+        return touched
+
+    def _unlink(self, friendly_name: str, client_id: str) -> None:
+        """Drop a clientId from a friendly name's members."""
+        members = self._members.get(friendly_name)
+        if members is None:
+            return
+        members.pop(client_id, None)
+        self._reindex(friendly_name)
+
+    def _reindex(self, friendly_name: str) -> None:
+        """Recompute the preferred client for a friendly name."""
+        members = self._members.get(friendly_name)
+        if not members:
+            self._members.pop(friendly_name, None)
+            self._preferred.pop(friendly_name, None)
+            return
+        first: ClientState | None = None
+        for client_id in members:
+            client = self._clients[client_id]
+            if client.connected:
+                self._preferred[friendly_name] = client
+                return
+            if first is None:
+                first = client
+        self._preferred[friendly_name] = first
+
+
+class ZoneIndex:
+    """Zones with id <-> display name lookups and a cached options list.
+
+    The index is rebuilt only when the zone list actually changes; the
+    version increments on every rebuild.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self.version = 0
+        self.zones: tuple[ZoneState, ...] = ()
+        self.options: list[str] = []
+        self._by_id: dict[str, ZoneState] = {}
+        self._by_name: dict[str, ZoneState] = {}
+
+    def update(self, zones: tuple[ZoneState, ...]) -> bool:
+        """Rebuild the index if the zones changed; returns True if they did."""
+        if zones == self.zones:
+            return False
+        self.zones = zones
+        self._by_id = {zone.zone_id: zone for zone in zones}
+        self._by_name = {zone.display_name: zone for zone in zones}
+        self.options = [zone.display_name for zone in zones]
+        self.version += 1
+        return True
+
+    def id_for_name(self, display_name: str) -> str | None:
+        """Return the id of the zone with a display name."""
+        zone = self._by_name.get(display_name)
+        return zone.zone_id if zone else None
+
+    def name_for_id(self, zone_id: str) -> str | None:
+        """Return the display name of a zone id."""
+        zone = self._by_id.get(zone_id)
+        return zone.display_name if zone else None
+
+
+class RoonNowPlayingCoordinator(DataUpdateCoordinator[ClientRegistry]):
     """Coordinator to manage WebSocket connection and data."""
 
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
@@ -35,30 +406,350 @@ class RoonNowPlayingCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.host: str = entry.data[CONF_HOST]
         self._ws: aiohttp.ClientWebSocketResponse | None = None
         self._ws_task: asyncio.Task | None = None
-        self._clients: dict[str, dict[str, Any]] = {}
-        self._zones: list[dict[str, str]] = []
+        self._clients = ClientRegistry()
+        self._zones = ZoneIndex()
+        self._zones_changed = False
         self._connected = False
+        self.connection_stats = ConnectionStats()
+        # (ping payload, waiter) of the heartbeat awaiting a pong
+        self._pong_waiter: tuple[bytes, asyncio.Future[None]] | None = None
+        # Last known clients and zones, restored before live data arrives
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, STORAGE_KEY.format(entry_id=entry.entry_id)
+        )
+        self.stale = False
+        # friendlyName -> wall clock time the screen was last connected
+        self._last_seen: dict[str, float] = {}
+        self._retention: float = (
+            entry.options.get(CONF_RETENTION_DAYS, DEFAULT_RETENTION_DAYS) * 86400
+        )
+        self._unsub_eviction: CALLBACK_TYPE | None = None
+        # Set once the first live clients_list has been applied
+        self._ready = asyncio.Event()
+        # friendlyName -> callbacks of the entities for that screen
+        self._client_listeners: dict[str, list[CALLBACK_TYPE]] = {}
+        # Callbacks of entities exposing the zone list
+        self._zone_listeners: list[CALLBACK_TYPE] = []
+        # zoneId -> playback state, and callbacks of that zone's entities
+        self._now_playing: dict[str, NowPlaying] = {}
+        self._now_playing_listeners: dict[str, list[CALLBACK_TYPE]] = {}
+        self._pending_zones: set[str] = set()
+        # Friendly names that have entities, and platform discovery callbacks
+        self._screens: set[str] = set()
+        self._new_screen_listeners: list[Callable[[str], None]] = []
+        # Messages applied since the last publish
+        self._coalesce_window: float = (
+            entry.options.get(CONF_COALESCE_WINDOW, DEFAULT_COALESCE_WINDOW) / 1000
+        )
+        self._pending_names: set[str] = set()
+        self._pending_messages = 0
+        self._publish_handle: asyncio.Handle | None = None
+        self.coalesce_stats = CoalesceStats()
+        self._push_queues: dict[str, ClientPushQueue] = {}
+        self._push_transport: str = entry.options.get(
+            CONF_PUSH_TRANSPORT, DEFAULT_PUSH_TRANSPORT
+        )
+        # Options the coordinator was built with; other entry updates only
+        # refresh the cached capabilities and need no reload
+        self.options = dict(entry.options)
+        # What the server supports, cached on the entry per server version
+        self.capabilities = ServerCapabilities()
+        self._ws_push = False
+        self._ws_compress = 0
+        self._async_apply_capabilities(
+            ServerCapabilities.from_payload(entry.data.get(CONF_CAPABILITIES) or {})
+        )
+        # clientId -> (settings, future) waiting for the next bulk push
+        self._bulk_pending: dict[str, tuple[dict[str, str], asyncio.Future[bool]]] = {}
+        self._bulk_task: asyncio.Task | None = None
+        # requestId -> (clientId, future) for pushes sent over the WebSocket
+        self._pending_acks: dict[str, tuple[str, asyncio.Future[bool | None]]] = {}
+        self._request_ids = itertools.count(1)
+        # friendlyName -> select key -> (optimistic value, cancel deadline)
+        self._optimistic: dict[str, dict[str, tuple[str, CALLBACK_TYPE]]] = {}
+        self._device_info: dict[str, DeviceInfo] = {}
+        # Message type -> handler returning the touched screens (None: no publish)
+        self._handlers: dict[str, Callable[[dict[str, Any]], set[str] | None]] = {
+            "push_ack": self._handle_push_ack,
+            "clients_list": self._handle_clients_list,
+            "client_connected": self._handle_client_connected,
+            "client_disconnected": self._handle_client_disconnected,
+            "client_updated": self._handle_client_updated,
+            "zones": self._handle_zones,
+            "now_playing": self._handle_now_playing,
+            "seek_position": self._handle_seek_position,
+        }
+        self._json_loads = get_json_loads()
+        self.ignored_messages = 0
+        # Frames read from the socket, applied by a separate handler task
+        self.inbound = InboundQueue(INBOUND_QUEUE_SIZE)
+        self.metrics = CoordinatorMetrics()
+        self.artwork = ArtworkCache(hass, self.host)
+        # Recent traffic for the diagnostics download
+        self.trace = TraceBuffer()
+        # Server sequence numbers, checked by the reader before queueing
+        self.sequence = SequenceTracker()
+        self._resync_pending = False
+        self._handler_task: asyncio.Task | None = None
+        # Bus events for screen and track changes
+        self.events = EventFilter(hass)
 
     @property
-    def clients(self) -> dict[str, dict[str, Any]]:
-        """Return current clients (only named ones)."""
-        return {
-            client_id: client
-            for client_id, client in self._clients.items()
-            if client.get("friendlyName")
-        }
+    def screens(self) -> list[str]:
+        """Return the friendly names announced to the platforms."""
+        return list(self._screens)
+
+    def get_client(self, friendly_name: str) -> ClientState | None:
+        """Return the client for a friendly name (prefers connected clients)."""
+        return self._clients.get_by_name(friendly_name)
 
     @property
-    def zones(self) -> list[dict[str, str]]:
+    def zones(self) -> tuple[ZoneState, ...]:
         """Return available zones."""
+        return self._zones.zones
+
+    def get_now_playing(self, zone_id: str) -> NowPlaying | None:
+        """Return the playback state of a zone."""
+        return self._now_playing.get(zone_id)
+
+    @property
+    def client_count(self) -> int:
+        """Return the number of tracked clients, connected or not."""
+        return len(self._clients)
+
+    @property
+    def zone_index(self) -> ZoneIndex:
+        """Return the zone index."""
         return self._zones
 
+    def device_info(self, friendly_name: str) -> DeviceInfo:
+        """Return the device info of a screen, shared by its entities."""
+        if (device_info := self._device_info.get(friendly_name)) is None:
+            device_info = self._device_info[friendly_name] = DeviceInfo(
+                identifiers={(DOMAIN, friendly_name)},
+                name=friendly_name,
+                manufacturer="Roon Now Playing",
+                model="Display Screen",
+            )
+        return device_info
+
+    @property
+    def hub_device_info(self) -> DeviceInfo:
+        """Return the device info of the server, used by diagnostic entities."""
+        return DeviceInfo(
+            identifiers={(DOMAIN, self.entry.entry_id)},
+            name=self.entry.title,
+            manufacturer="Roon Now Playing",
+            model="Server",
+            entry_type=dr.DeviceEntryType.SERVICE,
+            configuration_url=self.host,
+        )
+
+    @callback
+    def async_add_client_listener(
+        self, friendly_name: str, update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Listen for updates to one screen; returns a function to unsubscribe."""
+        listeners = self._client_listeners.setdefault(friendly_name, [])
+        listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            listeners.remove(update_callback)
+            if not listeners:
+                self._client_listeners.pop(friendly_name, None)
+
+        return remove_listener
+
+    @callback
+    def async_add_new_screen_listener(
+        self, new_screen_callback: Callable[[str], None]
+    ) -> CALLBACK_TYPE:
+        """Listen for newly named screens; returns a function to unsubscribe."""
+        self._new_screen_listeners.append(new_screen_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._new_screen_listeners.remove(new_screen_callback)
+
+        return remove_listener
+
+    @callback
+    def async_add_zones_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Listen for zone list changes; returns a function to unsubscribe."""
+        self._zone_listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._zone_listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def async_add_now_playing_listener(
+        self, zone_id: str, update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Listen for playback changes of one zone; returns a function to unsubscribe."""
+        listeners = self._now_playing_listeners.setdefault(zone_id, [])
+        listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            listeners.remove(update_callback)
+            if not listeners:
+                self._now_playing_listeners.pop(zone_id, None)
+
+        return remove_listener
+
+    @callback
+    def _async_notify_clients(self, friendly_names: set[str]) -> None:
+        """Notify the entities of the given screens."""
+        for friendly_name in friendly_names:
+            for update_callback in list(self._client_listeners.get(friendly_name, ())):
+                update_callback()
+
+    def get_optimistic(self, friendly_name: str, key: str) -> str | None:
+        """Return the unconfirmed value selected for a screen setting."""
+        if pending := self._optimistic.get(friendly_name):
+            if key in pending:
+                return pending[key][0]
+        return None
+
+    @callback
+    def async_set_optimistic(self, friendly_name: str, key: str, value: str) -> None:
+        """Show a selected value until the server confirms or the deadline passes."""
+        self._async_clear_optimistic(friendly_name, key)
+        cancel = async_call_later(
+            self.hass,
+            OPTIMISTIC_TIMEOUT,
+            partial(self._async_optimistic_expired, friendly_name, key, value),
+        )
+        self._optimistic.setdefault(friendly_name, {})[key] = (value, cancel)
+        self._async_notify_clients({friendly_name})
+
+    @callback
+    def async_rollback_optimistic(
+        self, friendly_name: str, key: str, value: str
+    ) -> None:
+        """Revert an optimistic value after its push failed."""
+        if self.get_optimistic(friendly_name, key) != value:
+            # A newer selection replaced it
+            return
+        _LOGGER.warning(
+            "Failed to set %s of %s to %s, reverting", key, friendly_name, value
+        )
+        self._async_clear_optimistic(friendly_name, key)
+        self._async_notify_clients({friendly_name})
+
+    @callback
+    def _async_optimistic_expired(
+        self, friendly_name: str, key: str, value: str, _now: Any
+    ) -> None:
+        """Revert an optimistic value the server never confirmed."""
+        if self.get_optimistic(friendly_name, key) != value:
+            return
+        _LOGGER.warning(
+            "No confirmation setting %s of %s to %s, reverting",
+            key,
+            friendly_name,
+            value,
+        )
+        self._async_clear_optimistic(friendly_name, key)
+        self._async_notify_clients({friendly_name})
+
+    @callback
+    def _async_clear_optimistic(self, friendly_name: str, key: str) -> None:
+        """Drop an optimistic value and its deadline."""
+        pending = self._optimistic.get(friendly_name)
+        if not pending or key not in pending:
+            return
+        _value, cancel = pending.pop(key)
+        cancel()
+        if not pending:
+            del self._optimistic[friendly_name]
+
+    @callback
+    def _async_reconcile_optimistic(self, friendly_names: set[str]) -> None:
+        """Clear optimistic values that the server now reports."""
+        for friendly_name in friendly_names & self._optimistic.keys():
+            client = self._clients.get_by_name(friendly_name)
+            if client is None:
+                continue
+            for key, (value, _cancel) in list(self._optimistic[friendly_name].items()):
+                if getattr(client, OPTIMISTIC_FIELDS[key]) == value:
+                    self._async_clear_optimistic(friendly_name, key)
+
+    async def async_load_snapshot(self) -> None:
+        """Restore the last known clients and zones from storage."""
+        if not (snapshot := await self._store.async_load()):
+            return
+        # Only the settings are restored; whether a screen is connected is
+        # unknown until the server answers
+        self._clients.replace(
+            replace(ClientState.from_payload(client), connected=False)
+            for client in snapshot.get("clients", [])
+        )
+        self._zones.update(
+            tuple(ZoneState.from_payload(zone) for zone in snapshot.get("zones", []))
+        )
+        self._last_seen = snapshot.get("last_seen", {})
+        self._screens.update(self._clients.named())
+        # Restored state is shown until the first clients_list replaces it
+        self.stale = len(self._clients) > 0
+        _LOGGER.debug("Restored snapshot: %d clients", len(self._clients))
+
+    @callback
+    def _snapshot_data(self) -> dict[str, Any]:
+        """Return the state to persist."""
+        return {
+            "clients": [client.as_payload() for client in self._clients.values()],
+            "zones": [zone.as_payload() for zone in self._zones.zones],
+            "last_seen": self._last_seen,
+        }
+
+    @property
+    def ready(self) -> bool:
+        """Return True once live client data has been received."""
+        return self._ready.is_set()
+
+    async def async_wait_ready(self, timeout: float) -> bool:
+        """Wait for live client data; returns False on timeout."""
+        try:
+            async with asyncio.timeout(timeout):
+                await self._ready.wait()
+        except TimeoutError:
+            return False
+        return True
+
     async def async_start(self) -> None:
-        """Start the WebSocket connection."""
-        self._ws_task = asyncio.create_task(self._ws_loop())
+        """Start the WebSocket connection in the background."""
+        self._handler_task = self.entry.async_create_background_task(
+            self.hass, self._async_handle_inbound(), f"{DOMAIN} handler {self.host}"
+        )
+        self._ws_task = self.entry.async_create_background_task(
+            self.hass, self._ws_loop(), f"{DOMAIN} websocket {self.host}"
+        )
+        self._unsub_eviction = async_track_time_interval(
+            self.hass, self._async_evict, EVICTION_INTERVAL
+        )
 
     async def async_stop(self) -> None:
         """Stop the WebSocket connection."""
+        if self._unsub_eviction:
+            self._unsub_eviction()
+            self._unsub_eviction = None
+        if self._publish_handle:
+            self._publish_handle.cancel()
+            self._publish_handle = None
+        for pending in self._optimistic.values():
+            for _value, cancel in pending.values():
+                cancel()
+        self._optimistic.clear()
+        for queue in self._push_queues.values():
+            await queue.async_cancel()
+        if self._bulk_task:
+            self._bulk_task.cancel()
+            self._bulk_task = None
         if self._ws_task:
             self._ws_task.cancel()
             try:
@@ -67,104 +758,624 @@ class RoonNowPlayingCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 pass
         if self._ws:
             await self._ws.close()
+        self.artwork.clear()
+        if self._handler_task:
+            self._handler_task.cancel()
+            try:
+                await self._handler_task
+            except asyncio.CancelledError:
+                pass
+        # Write now, replacing the pending delayed save, so nothing is written
+        # after the entry is unloaded or removed
+        await self._store.async_save(self._snapshot_data())
+
+    @callback
+    def _async_evict(self, _now: Any = None) -> None:
+        """Drop old disconnected clients and retire screens gone too long."""
+        touched = self._clients.evict(CLIENT_TTL, MAX_DISCONNECTED_CLIENTS)
+
+        now = time.time()
+        last_seen: dict[str, float] = {}
+        device_registry = dr.async_get(self.hass)
+        for device in dr.async_entries_for_config_entry(
+            device_registry, self.entry.entry_id
+        ):
+            friendly_name = next(
+                (ident for domain, ident in device.identifiers if domain == DOMAIN),
+                None,
+            )
+            if friendly_name is None or friendly_name == self.entry.entry_id:
+                # The server's own device is never retired
+                continue
+            client = self._clients.get_by_name(friendly_name)
+            if client is not None and client.connected:
+                last_seen[friendly_name] = now
+                continue
+            seen = self._last_seen.get(friendly_name, now)
+            if now - seen < self._retention:
+                last_seen[friendly_name] = seen
+                continue
+
+            _LOGGER.info(
+                "Removing screen %s, not seen for %d days",
+                friendly_name,
+                (now - seen) // 86400,
+            )
+            # Removing the device also removes its entities
+            device_registry.async_update_device(
+                device.id, remove_config_entry_id=self.entry.entry_id
+            )
+            self._clients.remove_name(friendly_name)
+            self._screens.discard(friendly_name)
+            self.events.async_forget(
+                ("connection", friendly_name), ("settings", friendly_name)
+            )
+            touched.add(friendly_name)
+        self._last_seen = last_seen
+
+        # Push queues of evicted clients are no longer reachable
+        for client_id in list(self._push_queues):
+            if client_id not in self._clients:
+                queue = self._push_queues.pop(client_id)
+                self.hass.async_create_task(queue.async_cancel())
+
+        if touched:
+            _LOGGER.debug("Evicted clients of %d screens", len(touched))
+            self._async_notify_clients(touched)
+        self._store.async_delay_save(self._snapshot_data, SNAPSHOT_SAVE_DELAY)
+
+    @callback
+    def async_forget_screen(self, friendly_name: str) -> None:
+        """Drop every client of a screen whose device is being removed."""
+        self._clients.remove_name(friendly_name)
+        self._screens.discard(friendly_name)
+        self._last_seen.pop(friendly_name, None)
+        self.events.async_forget(
+            ("connection", friendly_name), ("settings", friendly_name)
+        )
+        self._async_notify_clients({friendly_name})
+        self._store.async_delay_save(self._snapshot_data, SNAPSHOT_SAVE_DELAY)
 
     async def _ws_loop(self) -> None:
-        """Main WebSocket loop with reconnection."""
+        """Supervise the WebSocket connection, reconnecting with backoff."""
         session = async_get_clientsession(self.hass)
+        attempt = 0
 
         while True:
+            started = time.monotonic()
             try:
                 await self._connect_and_listen(session)
             except (aiohttp.ClientError, asyncio.TimeoutError) as err:
                 _LOGGER.warning("WebSocket connection failed: %s", err)
-                self._connected = False
-                self.async_set_updated_data(self._clients)
             except asyncio.CancelledError:
                 break
+            except Exception:  # pylint: disable=broad-except
+                # Only cancellation may end the supervisor
+                _LOGGER.exception("Unexpected error in WebSocket connection")
+            finally:
+                self._connected = False
+                self.connection_stats.connected_since = None
+                self.connection_stats.connected_at = None
 
-            _LOGGER.info("Reconnecting in %s seconds...", RECONNECT_INTERVAL)
-            await asyncio.sleep(RECONNECT_INTERVAL)
+            self.async_set_updated_data(self._clients)
+            if time.monotonic() - started >= STABLE_CONNECTION:
+                attempt = 0
+            delay = backoff_delay(attempt)
+            attempt += 1
+            self.connection_stats.reconnects += 1
+            if delay:
+                _LOGGER.info("Reconnecting in %.1f seconds...", delay)
+                await asyncio.sleep(delay)
 
     async def _connect_and_listen(self, session: aiohttp.ClientSession) -> None:
         """Connect to WebSocket and listen for messages."""
+        await self._async_negotiate(session)
         parsed = urlparse(self.host)
         ws_scheme = "wss" if parsed.scheme == "https" else "ws"
         ws_url = f"{ws_scheme}://{parsed.netloc}/ws?admin=true"
         _LOGGER.info("Connecting to %s", ws_url)
 
+        # Pings are answered and tracked here so the round-trip can be measured
         async with session.ws_connect(
             ws_url,
-            timeout=aiohttp.ClientTimeout(total=30)
+            timeout=aiohttp.ClientTimeout(total=30),
+            autoping=False,
+            compress=self._ws_compress,
         ) as ws:
             self._ws = ws
             self._connected = True
+            self.connection_stats.connected_since = time.monotonic()
+            self.connection_stats.connected_at = dt_util.utcnow()
+            self.sequence.reset()
+            self._resync_pending = False
             _LOGGER.info("WebSocket connected")
+            heartbeat = self.entry.async_create_background_task(
+                self.hass, self._async_heartbeat(ws), f"{DOMAIN} heartbeat"
+            )
 
-            async for msg in ws:
-                if msg.type == aiohttp.WSMsgType.TEXT:
-                    try:
-                        await self._handle_message(msg.json())
-                    except ValueError as err:
-                        _LOGGER.warning("Failed to parse WebSocket message: %s", err)
-                elif msg.type == aiohttp.WSMsgType.ERROR:
-                    _LOGGER.error("WebSocket error: %s", ws.exception())
-                    break
-                elif msg.type == aiohttp.WSMsgType.CLOSED:
-                    _LOGGER.info("WebSocket closed")
-                    break
-
-    async def _handle_message(self, data: dict[str, Any]) -> None:
-        """Handle incoming WebSocket message."""
-        msg_type = data.get("type")
+            try:
+                async for msg in ws:
+                    if msg.type == aiohttp.WSMsgType.TEXT:
+                        # Skip message types without a handler before decoding
+                        msg_type = sniff_type(msg.data)
+                        if msg_type is not None and msg_type not in self._handlers:
+                            self.ignored_messages += 1
+                            if (seq := sniff_seq(msg.data)) is not None:
+                                await self._async_check_sequence(ws, seq, msg_type)
+                            continue
+                        try:
+                            data = self._json_loads(msg.data)
+                        except ValueError as err:
+                            _LOGGER.warning("Failed to parse WebSocket message: %s", err)
+                            continue
+                        if isinstance(data, dict):
+                            if isinstance(seq := data.get("seq"), int):
+                                await self._async_check_sequence(
+                                    ws, seq, data.get("type")
+                                )
+                            await self._async_enqueue(data, msg.data)
+                    elif msg.type == aiohttp.WSMsgType.PING:
+                        try:
+                            await ws.pong(msg.data)
+                        except (aiohttp.ClientError, ConnectionError) as err:
+                            # The transport is closing; reconnect
+                            _LOGGER.debug("Failed to answer ping: %s", err)
+                            break
+                    elif msg.type == aiohttp.WSMsgType.PONG:
+                        if self._pong_waiter and self._pong_waiter[0] == msg.data:
+                            if not self._pong_waiter[1].done():
+                                self._pong_waiter[1].set_result(None)
+                    elif msg.type == aiohttp.WSMsgType.ERROR:
+                        _LOGGER.error("WebSocket error: %s", ws.exception())
+                        break
+                    elif msg.type == aiohttp.WSMsgType.CLOSED:
+                        _LOGGER.info("WebSocket closed")
+                        break
+            finally:
+                heartbeat.cancel()
+                self._ws = None
+                # Pushes awaiting an ack fall back to REST
+                self._async_resolve_acks(None)
 
+    async def _async_negotiate(self, session: aiohttp.ClientSession) -> None:
+        """Refresh the cached capabilities if the server version changed."""
+        try:
+            version = await async_get_version(session, self.host)
+            if (
+                CONF_CAPABILITIES in self.entry.data
+                and version == self.capabilities.version
+            ):
+                return
+            capabilities = await async_get_capabilities(session, self.host, version)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            # Keep the cached capabilities; connecting reports the failure
+            _LOGGER.debug("Failed to fetch server capabilities: %s", err)
+            return
+
+        _LOGGER.debug("Server version %s capabilities: %s", version, capabilities)
+        old = self.capabilities
+        self._async_apply_capabilities(capabilities)
+        self.hass.config_entries.async_update_entry(
+            self.entry,
+            data={**self.entry.data, CONF_CAPABILITIES: capabilities.as_payload()},
+        )
+        if (old.layouts, old.fonts, old.backgrounds) != (
+            capabilities.layouts,
+            capabilities.fonts,
+            capabilities.backgrounds,
+        ):
+            # Select entities show the new option lists
+            self._async_notify_clients(set(self._clients.named()))
+
+    @callback
+    def _async_apply_capabilities(self, capabilities: ServerCapabilities) -> None:
+        """Use the capabilities of the connected server version."""
+        self.capabilities = capabilities
+        self._ws_push = self._push_transport == PUSH_TRANSPORT_WEBSOCKET or (
+            self._push_transport == PUSH_TRANSPORT_AUTO and capabilities.ws_push
+        )
+        self._ws_compress = (
+            WS_COMPRESSION
+            if capabilities.ws_compression and not is_local_host(self.host)
+            else 0
+        )
+
+    async def _async_heartbeat(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        """Ping the server and drop the connection when pongs stop arriving."""
+        for ping_id in itertools.count(1):
+            await asyncio.sleep(HEARTBEAT_INTERVAL)
+            if ws.closed:
+                return
+            payload = str(ping_id).encode()
+            waiter: asyncio.Future[None] = self.hass.loop.create_future()
+            self._pong_waiter = (payload, waiter)
+            sent = time.monotonic()
+            try:
+                await ws.ping(payload)
+                async with asyncio.timeout(PONG_TIMEOUT):
+                    await waiter
+            except TimeoutError:
+                self.connection_stats.missed_pongs += 1
+                _LOGGER.warning(
+                    "No pong within %s seconds, reconnecting", PONG_TIMEOUT
+                )
+                await ws.close()
+                return
+            except (aiohttp.ClientError, ConnectionError, RuntimeError):
+                return
+            finally:
+                self._pong_waiter = None
+            self.connection_stats.latency = time.monotonic() - sent
+
+    async def _async_check_sequence(
+        self, ws: aiohttp.ClientWebSocketResponse, seq: int, msg_type: str | None
+    ) -> None:
+        """Request a resync when frames were missed.
+
+        Runs in the reader, so frames dropped by the inbound queue are not
+        mistaken for gaps.
+        """
+        gap = self.sequence.observe(seq)
         if msg_type == "clients_list":
-            # Full refresh of clients
-            self._clients = {
-                client["clientId"]: client
-                for client in data.get("clients", [])
-            }
-            _LOGGER.debug("Received clients list: %d clients", len(self._clients))
-
-        elif msg_type == "client_connected":
-            # New client connected
-            client = data.get("client", {})
-            client_id = client.get("clientId")
-            friendly_name = client.get("friendlyName")
-            if client_id:
-                # Remove old disconnected entries with same friendlyName
-                if friendly_name:
-                    old_ids = [
-                        cid for cid, c in self._clients.items()
-                        if c.get("friendlyName") == friendly_name and c.get("_disconnected")
-                    ]
-                    for old_id in old_ids:
-                        del self._clients[old_id]
-                self._clients[client_id] = client
-                _LOGGER.debug("Client connected: %s", friendly_name or client_id)
-
-        elif msg_type == "client_disconnected":
-            # Client disconnected
-            client_id = data.get("clientId")
-            if client_id and client_id in self._clients:
-                # Mark as disconnected but keep in dict for entity updates
-                self._clients[client_id]["_disconnected"] = True
-                _LOGGER.debug("Client disconnected: %s", client_id)
-
-        elif msg_type == "client_updated":
-            # Client settings changed
-            client = data.get("client", {})
-            client_id = client.get("clientId")
-            if client_id:
-                self._clients[client_id] = client
-                _LOGGER.debug("Client updated: %s", client.get("friendlyName", client_id))
-
-        elif msg_type == "zones":
-            # Zone list updated
-            self._zones = data.get("zones", [])
-            _LOGGER.debug("Received zones: %d zones", len(self._zones))
-
-        # Notify entities of update
+            # A full list supersedes anything missed before it
+            self._resync_pending = False
+            return
+        if not gap or self._resync_pending:
+            return
+        _LOGGER.debug("Missed frames before sequence %d, requesting resync", seq)
+        self._resync_pending = True
+        self.connection_stats.resyncs += 1
+        try:
+            await ws.send_json(RESYNC_REQUEST)
+        except (aiohttp.ClientError, ConnectionError) as err:
+            _LOGGER.debug("Failed to request resync: %s", err)
+
+    async def _async_enqueue(self, data: dict[str, Any], text: str) -> None:
+        """Queue a message for the handler, waiting while the queue is full."""
+        received = time.perf_counter()
+        coalesce_key: str | None = None
+        msg_type = data.get("type")
+        if msg_type == "client_updated":
+            client = data.get("client")
+            if isinstance(client, dict) and "clientId" in client:
+                # A newer update for the same client supersedes a queued one
+                coalesce_key = client["clientId"]
+        elif msg_type == "seek_position" and "zoneId" in data:
+            # Only the latest progress tick of a zone matters
+            coalesce_key = f"seek_position:{data['zoneId']}"
+        await self.inbound.put((data, text, received), coalesce_key)
+
+    async def _async_handle_inbound(self) -> None:
+        """Apply queued messages, yielding to the event loop between batches."""
+        handled = 0
+        metrics = self.metrics
+        trace = self.trace
+        while True:
+            data, text, received = await self.inbound.get()
+            started = time.perf_counter()
+            try:
+                self._handle_message(data)
+            except Exception:  # noqa: BLE001
+                _LOGGER.exception("Error handling %s message", data.get("type"))
+            duration = time.perf_counter() - started
+            metrics.handle_time.add(duration)
+            metrics.messages.add()
+            trace.record(
+                TRACE_INBOUND,
+                received,
+                data.get("type"),
+                text,
+                started - received,
+                duration,
+                None,
+            )
+            handled += 1
+            if handled % HANDLER_BATCH == 0:
+                await asyncio.sleep(0)
+
+    @callback
+    def _handle_message(self, data: dict[str, Any]) -> None:
+        """Dispatch an incoming WebSocket message to its handler."""
+        handler = self._handlers.get(data.get("type"))
+        if handler is None:
+            return
+        # The first clients_list only sets the baseline for events
+        live = self._ready.is_set()
+        touched = handler(data)
+        if touched is not None:
+            if touched:
+                self._async_fire_screen_events(touched, live)
+            self._schedule_publish(touched)
+
+    @callback
+    def _async_fire_screen_events(self, friendly_names: set[str], live: bool) -> None:
+        """Fire connection and settings events for screens that changed."""
+        events = self.events
+        for friendly_name in friendly_names:
+            client = self._clients.get_by_name(friendly_name)
+            if client is None:
+                events.async_forget(
+                    ("connection", friendly_name), ("settings", friendly_name)
+                )
+                continue
+            was_connected = events.async_transition(
+                ("connection", friendly_name), client.connected
+            )
+            settings = tuple(getattr(client, key) for key in EVENT_SETTINGS)
+            old_settings = events.async_transition(("settings", friendly_name), settings)
+            if not live:
+                continue
+
+            data: dict[str, Any] | None = None
+            if client.connected != was_connected and (
+                client.connected or was_connected is not UNKNOWN
+            ):
+                data = self._screen_event_data(friendly_name, client)
+                events.async_fire(
+                    EVENT_CLIENT_CONNECTED
+                    if client.connected
+                    else EVENT_CLIENT_DISCONNECTED,
+                    friendly_name,
+                    data,
+                )
+            if old_settings is not UNKNOWN and old_settings != settings:
+                changed = {
+                    key: {"old": old, "new": new}
+                    for key, old, new in zip(EVENT_SETTINGS, old_settings, settings)
+                    if old != new
+                }
+                events.async_fire(
+                    EVENT_SETTINGS_CHANGED,
+                    friendly_name,
+                    {
+                        **(data or self._screen_event_data(friendly_name, client)),
+                        "changed": changed,
+                    },
+                )
+
+    @callback
+    def _screen_event_data(
+        self, friendly_name: str, client: ClientState
+    ) -> dict[str, Any]:
+        """Return the data shared by the events of a screen."""
+        device = dr.async_get(self.hass).async_get_device(
+            identifiers={(DOMAIN, friendly_name)}
+        )
+        return {
+            "entry_id": self.entry.entry_id,
+            "device_id": device.id if device else None,
+            "friendly_name": friendly_name,
+            "client_id": client.client_id,
+            "layout": client.layout,
+            "font": client.font,
+            "background": client.background,
+            "zone_id": client.zone_id,
+            "zone_name": client.zone_name,
+        }
+
+    @callback
+    def _async_fire_track_event(self, now_playing: NowPlaying) -> None:
+        """Fire an event when a zone starts playing another track."""
+        if now_playing.title is None:
+            # Stopping is no track; the last one stays the baseline
+            return
+        track = (
+            now_playing.title,
+            now_playing.artist,
+            now_playing.album,
+            now_playing.duration,
+        )
+        old = self.events.async_transition(("track", now_playing.zone_id), track)
+        # The first track seen for a zone is the baseline
+        if old is UNKNOWN or old == track:
+            return
+        self.events.async_fire(
+            EVENT_TRACK_CHANGED,
+            now_playing.zone_id,
+            {
+                "entry_id": self.entry.entry_id,
+                "zone_id": now_playing.zone_id,
+                "zone_name": self._zones.name_for_id(now_playing.zone_id),
+                "state": now_playing.state,
+                "title": now_playing.title,
+                "artist": now_playing.artist,
+                "album": now_playing.album,
+                "duration": now_playing.duration,
+                "image_key": now_playing.image_key,
+            },
+        )
+
+    @callback
+    def _handle_push_ack(self, data: dict[str, Any]) -> None:
+        """Resolve a push sent over the WebSocket."""
+        if pending := self._pending_acks.get(str(data.get("requestId"))):
+            if not pending[1].done():
+                pending[1].set_result(bool(data.get("success", True)))
+
+    @callback
+    def _handle_clients_list(self, data: dict[str, Any]) -> set[str]:
+        """Full list of clients, reconciled against the current state."""
+        diff = self._clients.reconcile(
+            ClientState.from_payload(client)
+            for client in data.get("clients", [])
+            if "clientId" in client
+        )
+        touched = diff.touched
+        if self.stale:
+            # Every restored screen drops its stale flag
+            self.stale = False
+            touched = touched | set(self._clients.named())
+        self._ready.set()
+        _LOGGER.debug(
+            "Received clients list: %d added, %d removed, %d changed",
+            len(diff.added),
+            len(diff.removed),
+            len(diff.changed),
+        )
+        return touched
+
+    @callback
+    def _handle_client_connected(self, data: dict[str, Any]) -> set[str]:
+        """New client connected."""
+        payload = data.get("client", {})
+        if not payload.get("clientId"):
+            return set()
+        client = ClientState.from_payload(payload)
+        # Remove old disconnected entries with same friendlyName
+        if client.friendly_name:
+            self._clients.remove_disconnected(client.friendly_name)
+        _LOGGER.debug("Client connected: %s", client.friendly_name or client.client_id)
+        return self._clients.upsert(client)
+
+    @callback
+    def _handle_client_disconnected(self, data: dict[str, Any]) -> set[str]:
+        """Client disconnected."""
+        client_id = data.get("clientId")
+        if not client_id or not (client := self._clients.mark_disconnected(client_id)):
+            return set()
+        # Marked as disconnected but kept for entity updates
+        _LOGGER.debug("Client disconnected: %s", client_id)
+        return {client.friendly_name} if client.friendly_name else set()
+
+    @callback
+    def _handle_client_updated(self, data: dict[str, Any]) -> set[str]:
+        """Client settings changed."""
+        payload = data.get("client", {})
+        if not payload.get("clientId"):
+            return set()
+        client = ClientState.from_payload(payload)
+        touched = self._clients.upsert(client)
+        # A settings update confirms pushes still awaiting an ack
+        self._async_resolve_acks(True, client.client_id)
+        _LOGGER.debug("Client updated: %s", client.friendly_name or client.client_id)
+        return touched
+
+    @callback
+    def _handle_zones(self, data: dict[str, Any]) -> set[str]:
+        """Zone list updated."""
+        zones = tuple(
+            ZoneState.from_payload(zone)
+            for zone in data.get("zones", [])
+            if "id" in zone and "display_name" in zone
+        )
+        if self._zones.update(zones):
+            # Only entities exposing the zone list need to know
+            self._zones_changed = True
+            zone_ids = {zone.zone_id for zone in zones}
+            for zone_id in self._now_playing.keys() - zone_ids:
+                del self._now_playing[zone_id]
+                self.events.async_forget(("track", zone_id))
+        _LOGGER.debug("Received zones: %d zones", len(zones))
+        return set()
+
+    @callback
+    def _handle_now_playing(self, data: dict[str, Any]) -> set[str] | None:
+        """Track, state or position of a zone changed."""
+        if not data.get("zoneId"):
+            return None
+        now = dt_util.utcnow()
+        now_playing = NowPlaying.from_payload(data, now)
+        old = self._now_playing.get(now_playing.zone_id)
+        if (
+            old is not None
+            and old.state == now_playing.state
+            and old.same_track(now_playing)
+            and not self._is_seek(old, now_playing.position, now)
+        ):
+            # Keep the old reference point; clients interpolate from it
+            now_playing = replace(
+                now_playing,
+                position=old.position,
+                position_updated_at=old.position_updated_at,
+            )
+        elif (
+            old is not None
+            and now_playing.position is None
+            and old.same_track(now_playing)
+        ):
+            # State changed without a position: freeze the interpolated one
+            now_playing = replace(
+                now_playing, position=old.position_at(now), position_updated_at=now
+            )
+        if now_playing == old:
+            return None
+        self._now_playing[now_playing.zone_id] = now_playing
+        self._pending_zones.add(now_playing.zone_id)
+        self._async_fire_track_event(now_playing)
+        return set()
+
+    @callback
+    def _handle_seek_position(self, data: dict[str, Any]) -> set[str] | None:
+        """Playback progress of a zone; only a seek updates state."""
+        now_playing = self._now_playing.get(data.get("zoneId"))
+        position = data.get("seek_position")
+        if now_playing is None or not isinstance(position, (int, float)):
+            return None
+        now = dt_util.utcnow()
+        if not self._is_seek(now_playing, position, now):
+            return None
+        self._now_playing[now_playing.zone_id] = replace(
+            now_playing, position=position, position_updated_at=now
+        )
+        self._pending_zones.add(now_playing.zone_id)
+        return set()
+
+    @staticmethod
+    def _is_seek(
+        now_playing: NowPlaying, position: float | None, now: datetime
+    ) -> bool:
+        """Return True if a reported position differs from the interpolated one."""
+        if position is None:
+            return False
+        expected = now_playing.position_at(now)
+        return expected is None or abs(expected - position) >= SEEK_TOLERANCE
+
+    @callback
+    def _schedule_publish(self, touched: set[str]) -> None:
+        """Queue touched screens for the next coalesced publish."""
+        self._pending_names |= touched
+        self._pending_messages += 1
+        if self._publish_handle is not None:
+            return
+        if self._coalesce_window:
+            self._publish_handle = self.hass.loop.call_later(
+                self._coalesce_window, self._async_publish
+            )
+        else:
+            self._publish_handle = self.hass.loop.call_soon(self._async_publish)
+
+    @callback
+    def _async_publish(self) -> None:
+        """Publish all messages applied since the last publish."""
+        self._publish_handle = None
+        touched, self._pending_names = self._pending_names, set()
+        self.coalesce_stats.record(self._pending_messages)
+        self._pending_messages = 0
+
+        self._async_reconcile_optimistic(touched)
+        # Announce screens seen for the first time so platforms add entities
+        named = self._clients.named()
+        for friendly_name in touched - self._screens:
+            if friendly_name in named:
+                self._screens.add(friendly_name)
+                for new_screen_callback in list(self._new_screen_listeners):
+                    new_screen_callback(friendly_name)
+        # Notify only the entities of screens the batch touched
+        started = time.perf_counter()
+        self._async_notify_clients(touched)
+        zones_changed, self._zones_changed = self._zones_changed, False
+        if zones_changed:
+            for update_callback in list(self._zone_listeners):
+                update_callback()
+        zones, self._pending_zones = self._pending_zones, set()
+        for zone_id in zones:
+            for update_callback in list(self._now_playing_listeners.get(zone_id, ())):
+                update_callback()
+        self.metrics.fanout_time.add(time.perf_counter() - started)
         self.async_set_updated_data(self._clients)
+        if touched or zones_changed:
+            # Playback state is not part of the snapshot
+            self._store.async_delay_save(self._snapshot_data, SNAPSHOT_SAVE_DELAY)
 
     async def async_push_settings(
         self,
@@ -173,12 +1384,13 @@ class RoonNowPlayingCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         font: str | None = None,
         background: str | None = None,
         zone_id: str | None = None,
-    ) -> bool:
-        """Push settings to a client via REST API."""
-        session = async_get_clientsession(self.hass)
-        url = f"{self.host}/api/admin/clients/{client_id}/push"
+    ) -> dict[str, bool]:
+        """Push settings to a client.
 
-        payload: dict[str, Any] = {}
+        Changes for the same client are merged into a single request; the
+        result maps each pushed field to whether it was applied.
+        """
+        payload: dict[str, str] = {}
         if layout is not None:
             payload["layout"] = layout
         if font is not None:
@@ -187,18 +1399,162 @@ class RoonNowPlayingCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             payload["background"] = background
         if zone_id is not None:
             payload["zoneId"] = zone_id
+        if not payload:
+            return {}
 
+        if (queue := self._push_queues.get(client_id)) is None:
+            queue = self._push_queues[client_id] = ClientPushQueue(
+                self.hass, client_id, self._async_send_settings
+            )
+        return await queue.async_push(payload)
+
+    async def _async_send_settings(
+        self, client_id: str, payload: dict[str, str]
+    ) -> bool:
+        """Send settings over the configured transport, falling back to REST."""
+        started = time.perf_counter()
+        result: bool | None = None
+        if self._ws_push and self._ws is not None:
+            result = await self._async_ws_push(self._ws, client_id, payload)
+            if result is None:
+                _LOGGER.debug("WebSocket push to %s failed, using REST", client_id)
+        if result is None:
+            result = await self._async_post_settings(client_id, payload)
+        duration = time.perf_counter() - started
+        self.metrics.push_rtt.add(duration)
+        self.metrics.push_failures.add(0.0 if result else 1.0)
+        self.trace.record(
+            TRACE_OUTBOUND,
+            started,
+            "push_settings",
+            {"clientId": client_id, "settings": payload},
+            None,
+            duration,
+            result,
+        )
+        return result
+
+    async def _async_ws_push(
+        self,
+        ws: aiohttp.ClientWebSocketResponse,
+        client_id: str,
+        payload: dict[str, str],
+    ) -> bool | None:
+        """Push settings over the admin WebSocket.
+
+        Returns the acknowledged result, or None if the push could not be
+        confirmed and should be retried over REST.
+        """
+        request_id = str(next(self._request_ids))
+        future: asyncio.Future[bool | None] = self.hass.loop.create_future()
+        self._pending_acks[request_id] = (client_id, future)
         try:
-            async with session.post(url, json=payload) as response:
+            await ws.send_json(
+                {
+                    "type": "push_settings",
+                    "requestId": request_id,
+                    "clientId": client_id,
+                    "settings": payload,
+                }
+            )
+            async with asyncio.timeout(WS_ACK_TIMEOUT):
+                result = await future
+        except (aiohttp.ClientError, ConnectionError, RuntimeError, TimeoutError):
+            return None
+        finally:
+            self._pending_acks.pop(request_id, None)
+        if result:
+            _LOGGER.debug("Pushed settings to %s over WebSocket: %s", client_id, payload)
+        return result
+
+    @callback
+    def _async_resolve_acks(
+        self, result: bool | None, client_id: str | None = None
+    ) -> None:
+        """Resolve pending WebSocket pushes (optionally for one client)."""
+        for pending_client_id, future in self._pending_acks.values():
+            if client_id is None or pending_client_id == client_id:
+                if not future.done():
+                    future.set_result(result)
+
+    async def _async_post_settings(
+        self, client_id: str, payload: dict[str, str]
+    ) -> bool:
+        """Push settings to a client via REST API."""
+        if self.capabilities.bulk_push:
+            return await self._async_post_bulk(client_id, payload)
+        session = async_get_clientsession(self.hass)
+        url = f"{self.host}/api/admin/clients/{client_id}/push"
+
+        try:
+            async with session.post(
+                url, json=payload, timeout=aiohttp.ClientTimeout(total=PUSH_TIMEOUT)
+            ) as response:
+                # Drain the body so the connection goes back to the keep-alive pool
+                await response.read()
                 if response.status == 200:
                     _LOGGER.debug("Pushed settings to %s: %s", client_id, payload)
                     return True
                 _LOGGER.error("Failed to push settings: %s", response.status)
                 return False
-        except aiohttp.ClientError as err:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
             _LOGGER.error("Error pushing settings: %s", err)
             return False
 
-    async def _async_update_data(self) -> dict[str, Any]:
+    async def _async_post_bulk(self, client_id: str, payload: dict[str, str]) -> bool:
+        """Push settings through the bulk endpoint with other pending pushes."""
+        # The client's push queue keeps one request per client in flight
+        future: asyncio.Future[bool] = self.hass.loop.create_future()
+        self._bulk_pending[client_id] = (payload, future)
+        if self._bulk_task is None:
+            self._bulk_task = self.hass.async_create_task(self._async_flush_bulk())
+        return await future
+
+    async def _async_flush_bulk(self) -> None:
+        """Send the pushes queued in this event loop iteration in bulk."""
+        await asyncio.sleep(0)
+        pending, self._bulk_pending = self._bulk_pending, {}
+        self._bulk_task = None
+        batch = list(pending.items())
+        await asyncio.gather(
+            *(
+                self._async_send_bulk(dict(batch[start : start + BULK_PUSH_MAX]))
+                for start in range(0, len(batch), BULK_PUSH_MAX)
+            )
+        )
+
+    async def _async_send_bulk(
+        self, pending: dict[str, tuple[dict[str, str], asyncio.Future[bool]]]
+    ) -> None:
+        """Push settings to several clients in one request."""
+        session = async_get_clientsession(self.hass)
+        url = f"{self.host}/api/admin/clients/push"
+        body = {
+            "clients": [
+                {"clientId": client_id, "settings": payload}
+                for client_id, (payload, _future) in pending.items()
+            ]
+        }
+        results: dict[str, Any] = {}
+        try:
+            async with session.post(
+                url, json=body, timeout=aiohttp.ClientTimeout(total=PUSH_TIMEOUT)
+            ) as response:
+                if response.status == 200:
+                    data = await response.json(content_type=None)
+                    if isinstance(data, dict) and isinstance(data.get("results"), dict):
+                        results = data["results"]
+                    _LOGGER.debug("Pushed settings to %d clients in bulk", len(pending))
+                else:
+                    await response.read()
+                    _LOGGER.error("Failed to push settings in bulk: %s", response.status)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as err:
+            _LOGGER.error("Error pushing settings in bulk: %s", err)
+        finally:
+            for client_id, (_payload, future) in pending.items():
+                if not future.done():
+                    future.set_result(bool(results.get(client_id)))
+
+    async def _async_update_data(self) -> ClientRegistry:
         """Fetch data - not used since we use WebSocket push."""
         return self._clients
@@ -0,0 +1,91 @@
+"""Diagnostics support for Roon Now Playing."""
+from __future__ import annotations
+
+from dataclasses import asdict
+import json
+import time
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import RoonNowPlayingCoordinator
+from .protocol import get_json_loads
+
+# Server address and what identifies the devices running the screens
+TO_REDACT = {CONF_HOST, "userAgent", "ip", "ipAddress", "remoteAddress"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: RoonNowPlayingCoordinator = hass.data[DOMAIN][entry.entry_id]
+    inbound = coordinator.inbound
+    return {
+        "entry": {
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "connection": asdict(coordinator.connection_stats),
+        "inbound": {
+            "depth": inbound.depth,
+            "max_depth": inbound.max_depth,
+            "dropped": inbound.dropped,
+            "blocked": inbound.blocked,
+            "ignored": coordinator.ignored_messages,
+        },
+        "sequence": {
+            "last": coordinator.sequence.last,
+            "gaps": coordinator.sequence.gaps,
+            "missed": coordinator.sequence.missed,
+        },
+        "coalesce": asdict(coordinator.coalesce_stats),
+        "artwork": {
+            **asdict(coordinator.artwork.stats),
+            "images": len(coordinator.artwork),
+            "bytes": coordinator.artwork.bytes,
+        },
+        "events": {
+            "fired": dict(coordinator.events.fired),
+            "rate_limited": dict(coordinator.events.rate_limited),
+        },
+        "clients": coordinator.client_count,
+        "screens": len(coordinator.screens),
+        "trace": _trace(coordinator),
+    }
+
+
+def _trace(coordinator: RoonNowPlayingCoordinator) -> list[dict[str, Any]]:
+    """Decode, size and redact the recorded traffic."""
+    loads = get_json_loads()
+    now = time.perf_counter()
+    trace: list[dict[str, Any]] = []
+    for direction, at, msg_type, payload, queued, duration, result in (
+        coordinator.trace.entries()
+    ):
+        if isinstance(payload, str):
+            size = len(payload.encode())
+            try:
+                payload = loads(payload)
+            except ValueError:
+                pass
+        else:
+            size = len(json.dumps(payload).encode())
+        trace.append(
+            {
+                "direction": direction,
+                "monotonic": round(at, 6),
+                "age": round(now - at, 3),
+                "type": msg_type,
+                "size": size,
+                "queued_ms": None if queued is None else round(queued * 1000, 3),
+                "duration_ms": round(duration * 1000, 3),
+                "result": result,
+                "payload": async_redact_data(payload, TO_REDACT),
+            }
+        )
+    return trace
@@ -0,0 +1,70 @@
+"""Base entity for Roon Now Playing."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.entity import Entity
+
+from .coordinator import RoonNowPlayingCoordinator
+from .models import ClientState
+
+
+class RoonNowPlayingEntity(Entity):
+    """Base entity for a named Roon Now Playing screen.
+
+    Entities subscribe to updates for their own friendly name only and skip
+    state writes when the derived state did not change.
+    """
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        coordinator: RoonNowPlayingCoordinator,
+        friendly_name: str,
+        key: str,
+    ) -> None:
+        """Initialize the entity."""
+        self.coordinator = coordinator
+        self._friendly_name = friendly_name
+        # Use friendly_name for unique_id to survive reconnects with new client_id
+        self._attr_unique_id = f"{friendly_name.lower().replace(' ', '_')}_{key}"
+        self._attr_device_info = coordinator.device_info(friendly_name)
+        self._last_state_key: tuple[Any, ...] | None = None
+
+    @property
+    def _client(self) -> ClientState | None:
+        """Return the client data by friendly name (prefers connected clients)."""
+        return self.coordinator.get_client(self._friendly_name)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Flag state restored from the snapshot until live data arrives."""
+        if self.coordinator.stale:
+            return {"stale": True}
+        return None
+
+    def _state_key(self) -> tuple[Any, ...]:
+        """Return the derived state used to detect no-op updates."""
+        return (self.available,)
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to updates for this screen."""
+        await super().async_added_to_hass()
+        self._last_state_key = (self.coordinator.stale, self._state_key())
+        self.async_on_remove(
+            self.coordinator.async_add_client_listener(
+                self._friendly_name, self._handle_client_update
+            )
+        )
+
+    @callback
+    def _handle_client_update(self) -> None:
+        """Write state only if the derived state changed."""
+        state_key = (self.coordinator.stale, self._state_key())
+        if state_key == self._last_state_key:
+            return
+        self._last_state_key = state_key
+        self.async_write_ha_state()
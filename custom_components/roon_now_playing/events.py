@@ -0,0 +1,102 @@
+"""Home Assistant bus events for Roon Now Playing."""
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Hashable
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+_LOGGER = logging.getLogger(__name__)
+
+EVENT_RATE = 1.0  # events per second refilled per event type and subject
+EVENT_BURST = 10  # events of one type and subject fired back to back
+
+# Returned by EventFilter.async_transition for a subject seen the first time
+UNKNOWN: Any = object()
+
+
+class EventFilter:
+    """Fire bus events on real transitions, deduplicated and rate limited.
+
+    The last value reported for each subject (a screen's connection or
+    settings, a zone's track) is kept, so repeated frames, resyncs and
+    replays after a reconnect never fire twice. Each event type then has
+    a token bucket per subject, so a screen or zone flapping cannot flood
+    the bus while a change applied to the whole fleet still fires for
+    every screen.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        rate: float = EVENT_RATE,
+        burst: int = EVENT_BURST,
+    ) -> None:
+        """Initialize the filter."""
+        self._hass = hass
+        self._rate = rate
+        self._burst = burst
+        # (kind, subject) -> last value reported
+        self._last: dict[tuple[str, str], Hashable] = {}
+        # (event type, subject) -> (tokens left, monotonic time of the last refill)
+        self._buckets: dict[tuple[str, str], tuple[float, float]] = {}
+        # (event type, subject) currently dropping events, logged once per burst
+        self._limiting: set[tuple[str, str]] = set()
+        self.fired: Counter[str] = Counter()
+        self.rate_limited: Counter[str] = Counter()
+
+    @callback
+    def async_transition(self, key: tuple[str, str], value: Hashable) -> Any:
+        """Record a subject's value and return the previous one.
+
+        Returns the value itself if nothing changed and UNKNOWN if the
+        subject was not seen before.
+        """
+        old = self._last.get(key, UNKNOWN)
+        self._last[key] = value
+        return old
+
+    @callback
+    def async_forget(self, *keys: tuple[str, str]) -> None:
+        """Drop subjects that no longer exist."""
+        for key in keys:
+            self._last.pop(key, None)
+        # A full bucket is the default; one still refilling is kept so a
+        # subject that keeps disappearing and coming back stays limited
+        subjects = {subject for _, subject in keys}
+        now = time.monotonic()
+        for bucket, (tokens, updated) in list(self._buckets.items()):
+            if (
+                bucket[1] in subjects
+                and tokens + (now - updated) * self._rate >= self._burst
+            ):
+                del self._buckets[bucket]
+                self._limiting.discard(bucket)
+
+    @callback
+    def async_fire(self, event_type: str, subject: str, data: dict[str, Any]) -> bool:
+        """Fire an event unless its subject is over the rate limit."""
+        bucket = (event_type, subject)
+        now = time.monotonic()
+        tokens, updated = self._buckets.get(bucket, (self._burst, now))
+        tokens = min(self._burst, tokens + (now - updated) * self._rate)
+        if tokens < 1:
+            self._buckets[bucket] = (tokens, now)
+            if bucket not in self._limiting:
+                self._limiting.add(bucket)
+                _LOGGER.warning(
+                    "Dropping %s events for %s: more than %d in a row",
+                    event_type,
+                    subject,
+                    self._burst,
+                )
+            self.rate_limited[event_type] += 1
+            return False
+        self._buckets[bucket] = (tokens - 1, now)
+        self._limiting.discard(bucket)
+        self.fired[event_type] += 1
+        self._hass.bus.async_fire(event_type, data)
+        return True
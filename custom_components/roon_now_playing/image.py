@@ -0,0 +1,105 @@
+"""Image platform for Roon Now Playing."""
+from __future__ import annotations
+
+from homeassistant.components.image import ImageEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .coordinator import RoonNowPlayingCoordinator
+from .models import ZoneState
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up album art images per Roon zone from a config entry."""
+    coordinator: RoonNowPlayingCoordinator = hass.data[DOMAIN][entry.entry_id]
+    known: set[str] = set()
+
+    @callback
+    def async_add_zones() -> None:
+        """Add entities for zones not seen before."""
+        new_zones = [zone for zone in coordinator.zones if zone.zone_id not in known]
+        known.update(zone.zone_id for zone in new_zones)
+        if new_zones:
+            async_add_entities(
+                RoonNowPlayingArtwork(hass, coordinator, zone) for zone in new_zones
+            )
+
+    async_add_zones()
+    entry.async_on_unload(coordinator.async_add_zones_listener(async_add_zones))
+
+
+class RoonNowPlayingArtwork(ImageEntity):
+    """Album art of the track playing in a Roon zone, served from the cache."""
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: RoonNowPlayingCoordinator,
+        zone: ZoneState,
+    ) -> None:
+        """Initialize the image entity."""
+        super().__init__(hass)
+        self.coordinator = coordinator
+        self._zone_id = zone.zone_id
+        self._attr_name = f"{zone.display_name} artwork"
+        self._attr_unique_id = f"{coordinator.entry.entry_id}_artwork_{zone.zone_id}"
+        self._attr_device_info = coordinator.hub_device_info
+        self._image_key = self._current_image_key()
+        self._last_available: bool | None = None
+        if self._image_key is not None:
+            self._attr_image_last_updated = dt_util.utcnow()
+
+    def _current_image_key(self) -> str | None:
+        """Return the image key of the zone's current track."""
+        now_playing = self.coordinator.get_now_playing(self._zone_id)
+        return now_playing.image_key if now_playing else None
+
+    @property
+    def available(self) -> bool:
+        """Return if the zone still exists."""
+        return self.coordinator.zone_index.name_for_id(self._zone_id) is not None
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to playback and zone list changes."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_now_playing_listener(
+                self._zone_id, self._handle_update
+            )
+        )
+        self.async_on_remove(
+            self.coordinator.async_add_zones_listener(self._handle_update)
+        )
+
+    @callback
+    def _handle_update(self) -> None:
+        """Write state when the artwork or availability changes."""
+        image_key = self._current_image_key()
+        available = self.available
+        if image_key == self._image_key and available == self._last_available:
+            return
+        if image_key != self._image_key:
+            self._image_key = image_key
+            self._attr_image_last_updated = dt_util.utcnow() if image_key else None
+        self._last_available = available
+        self.async_write_ha_state()
+
+    async def async_image(self) -> bytes | None:
+        """Return the album art bytes from the coordinator's cache."""
+        if self._image_key is None:
+            return None
+        image = await self.coordinator.artwork.async_get(self._image_key)
+        if image is None:
+            return None
+        self._attr_content_type = image.content_type
+        return image.content
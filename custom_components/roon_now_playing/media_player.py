@@ -0,0 +1,169 @@
+"""Media player platform for Roon Now Playing."""
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from homeassistant.components.media_player import (
+    MediaPlayerEntity,
+    MediaPlayerState,
+    MediaType,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN
+from .coordinator import RoonNowPlayingCoordinator
+from .models import NowPlaying, ZoneState
+
+# Server playback state -> media player state
+STATES = {
+    "playing": MediaPlayerState.PLAYING,
+    "paused": MediaPlayerState.PAUSED,
+    "loading": MediaPlayerState.BUFFERING,
+    "stopped": MediaPlayerState.IDLE,
+}
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up a media player per Roon zone from a config entry."""
+    coordinator: RoonNowPlayingCoordinator = hass.data[DOMAIN][entry.entry_id]
+    known: set[str] = set()
+
+    @callback
+    def async_add_zones() -> None:
+        """Add entities for zones not seen before."""
+        new_zones = [zone for zone in coordinator.zones if zone.zone_id not in known]
+        known.update(zone.zone_id for zone in new_zones)
+        if new_zones:
+            async_add_entities(
+                RoonNowPlayingZonePlayer(coordinator, zone) for zone in new_zones
+            )
+
+    async_add_zones()
+    entry.async_on_unload(coordinator.async_add_zones_listener(async_add_zones))
+
+
+class RoonNowPlayingZonePlayer(MediaPlayerEntity):
+    """Read-only player showing what a Roon zone is playing.
+
+    Progress ticks from the server do not write state; the frontend
+    interpolates the position from media_position_updated_at, and only
+    seeks, track and state changes are written.
+    """
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    _attr_media_content_type = MediaType.MUSIC
+
+    def __init__(
+        self,
+        coordinator: RoonNowPlayingCoordinator,
+        zone: ZoneState,
+    ) -> None:
+        """Initialize the media player."""
+        self.coordinator = coordinator
+        self._zone_id = zone.zone_id
+        self._attr_name = zone.display_name
+        self._attr_unique_id = f"{coordinator.entry.entry_id}_zone_{zone.zone_id}"
+        self._attr_device_info = coordinator.hub_device_info
+        self._last_state_key: tuple[Any, ...] | None = None
+
+    @property
+    def _now_playing(self) -> NowPlaying | None:
+        """Return the zone's playback state."""
+        return self.coordinator.get_now_playing(self._zone_id)
+
+    @property
+    def available(self) -> bool:
+        """Return if the zone still exists."""
+        return self.coordinator.zone_index.name_for_id(self._zone_id) is not None
+
+    @property
+    def state(self) -> MediaPlayerState | None:
+        """Return the playback state."""
+        if (now_playing := self._now_playing) is None:
+            return MediaPlayerState.IDLE
+        return STATES.get(now_playing.state, MediaPlayerState.IDLE)
+
+    @property
+    def media_title(self) -> str | None:
+        """Return the title of the current track."""
+        return now_playing.title if (now_playing := self._now_playing) else None
+
+    @property
+    def media_artist(self) -> str | None:
+        """Return the artist of the current track."""
+        return now_playing.artist if (now_playing := self._now_playing) else None
+
+    @property
+    def media_album_name(self) -> str | None:
+        """Return the album of the current track."""
+        return now_playing.album if (now_playing := self._now_playing) else None
+
+    @property
+    def media_duration(self) -> int | None:
+        """Return the duration of the current track in seconds."""
+        return now_playing.duration if (now_playing := self._now_playing) else None
+
+    @property
+    def media_image_hash(self) -> str | None:
+        """Return the image key, which changes with the artwork."""
+        return now_playing.image_key if (now_playing := self._now_playing) else None
+
+    async def async_get_media_image(self) -> tuple[bytes | None, str | None]:
+        """Return the album art from the coordinator's cache."""
+        if (image_key := self.media_image_hash) is None:
+            return None, None
+        image = await self.coordinator.artwork.async_get(image_key)
+        if image is None:
+            return None, None
+        return image.content, image.content_type
+
+    @property
+    def media_position(self) -> int | None:
+        """Return the position as of media_position_updated_at."""
+        if (now_playing := self._now_playing) is None or now_playing.position is None:
+            return None
+        return int(now_playing.position)
+
+    @property
+    def media_position_updated_at(self) -> datetime | None:
+        """Return when the position was last reported."""
+        if (now_playing := self._now_playing) is None:
+            return None
+        return now_playing.position_updated_at
+
+    def _state_key(self) -> tuple[Any, ...]:
+        """Return the derived state used to detect no-op updates."""
+        # NowPlaying is immutable; every change is a new instance
+        return (self.available, self._attr_name, self._now_playing)
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to playback and zone list changes."""
+        await super().async_added_to_hass()
+        self._last_state_key = self._state_key()
+        self.async_on_remove(
+            self.coordinator.async_add_now_playing_listener(
+                self._zone_id, self._handle_update
+            )
+        )
+        self.async_on_remove(
+            self.coordinator.async_add_zones_listener(self._handle_update)
+        )
+
+    @callback
+    def _handle_update(self) -> None:
+        """Write state only if the derived state changed."""
+        if (name := self.coordinator.zone_index.name_for_id(self._zone_id)) is not None:
+            self._attr_name = name
+        state_key = self._state_key()
+        if state_key == self._last_state_key:
+            return
+        self._last_state_key = state_key
+        self.async_write_ha_state()
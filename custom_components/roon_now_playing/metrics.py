@@ -0,0 +1,111 @@
+"""Rolling runtime metrics for Roon Now Playing."""
+from __future__ import annotations
+
+from collections import deque
+import time
+from typing import Any
+
+RATE_WINDOW = 60  # seconds
+SAMPLE_WINDOW = 256  # most recent samples kept
+TRACE_SIZE = 500  # most recent frames and pushes kept
+
+TRACE_INBOUND = "in"
+TRACE_OUTBOUND = "out"
+
+
+class RateCounter:
+    """Events per second over a sliding window of one-second buckets."""
+
+    def __init__(self, window: int = RATE_WINDOW) -> None:
+        """Initialize the counter."""
+        self._window = window
+        # (whole monotonic second, events in that second), oldest first
+        self._buckets: deque[list[int]] = deque()
+        self.total = 0
+
+    def add(self, count: int = 1) -> None:
+        """Record events."""
+        second = int(time.monotonic())
+        if self._buckets and self._buckets[-1][0] == second:
+            self._buckets[-1][1] += count
+        else:
+            self._buckets.append([second, count])
+            self._expire(second)
+        self.total += count
+
+    def rate(self) -> float:
+        """Return the average events per second over the window."""
+        self._expire(int(time.monotonic()))
+        return sum(count for _second, count in self._buckets) / self._window
+
+    def _expire(self, second: int) -> None:
+        """Drop buckets that left the window."""
+        while self._buckets and self._buckets[0][0] <= second - self._window:
+            self._buckets.popleft()
+
+
+class RollingSamples:
+    """The most recent samples of a measurement."""
+
+    def __init__(self, size: int = SAMPLE_WINDOW) -> None:
+        """Initialize the window."""
+        self._samples: deque[float] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        """Return the number of samples in the window."""
+        return len(self._samples)
+
+    def add(self, value: float) -> None:
+        """Record a sample."""
+        self._samples.append(value)
+
+    def mean(self) -> float | None:
+        """Return the mean of the window, or None without samples."""
+        if not self._samples:
+            return None
+        return sum(self._samples) / len(self._samples)
+
+    def percentile(self, pct: float) -> float | None:
+        """Return a percentile of the window (nearest rank)."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[round(pct / 100 * (len(ordered) - 1))]
+
+
+class CoordinatorMetrics:
+    """Rolling metrics recorded by the coordinator.
+
+    Recording is a deque append; percentiles are only computed when the
+    diagnostic sensors read them.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self.messages = RateCounter()
+        self.handle_time = RollingSamples()  # seconds per handled message
+        self.fanout_time = RollingSamples()  # seconds per publish
+        self.push_rtt = RollingSamples()  # seconds per settings push
+        self.push_failures = RollingSamples()  # 1.0 per failed push, else 0.0
+
+
+class TraceBuffer:
+    """Ring buffer of recent WebSocket frames and settings pushes.
+
+    Each entry is a tuple of direction, perf_counter() timestamp, message
+    type, payload (the raw frame text or the pushed dict), seconds queued,
+    seconds spent handling or sending, and the push result. Payloads are
+    kept by reference; sizing and redaction happen when the buffer is read.
+    """
+
+    def __init__(self, size: int = TRACE_SIZE) -> None:
+        """Initialize the buffer."""
+        self._entries: deque[tuple[Any, ...]] = deque(maxlen=size)
+
+    def record(self, *entry: Any) -> None:
+        """Record an entry, dropping the oldest when full."""
+        self._entries.append(entry)
+
+    def entries(self) -> list[tuple[Any, ...]]:
+        """Return the entries, oldest first."""
+        return list(self._entries)
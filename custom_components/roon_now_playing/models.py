@@ -0,0 +1,129 @@
+"""Data models for Roon Now Playing."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from .const import BACKGROUNDS, FONTS, LAYOUTS
+
+# Known option strings; parsed values are swapped for these shared instances
+_LAYOUTS = {layout: layout for layout in LAYOUTS}
+_FONTS = {font: font for font in FONTS}
+_BACKGROUNDS = {background: background for background in BACKGROUNDS}
+
+
+def _intern(value: Any, known: dict[str, str]) -> str | None:
+    """Return the shared instance of a known option string."""
+    if not isinstance(value, str):
+        return None
+    return known.get(value, value)
+
+
+@dataclass(slots=True)
+class ClientState:
+    """The fields of a server client that the integration uses."""
+
+    client_id: str
+    friendly_name: str | None = None
+    layout: str | None = None
+    font: str | None = None
+    background: str | None = None
+    zone_id: str | None = None
+    zone_name: str | None = None
+    connected: bool = True
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> ClientState:
+        """Parse a client as sent by the server."""
+        return cls(
+            client_id=payload["clientId"],
+            friendly_name=payload.get("friendlyName") or None,
+            layout=_intern(payload.get("layout"), _LAYOUTS),
+            font=_intern(payload.get("font"), _FONTS),
+            background=_intern(payload.get("background"), _BACKGROUNDS),
+            zone_id=payload.get("zoneId"),
+            zone_name=payload.get("zoneName"),
+            connected=not payload.get("_disconnected", False),
+        )
+
+    def as_payload(self) -> dict[str, Any]:
+        """Return the client in the server's format (used for the snapshot)."""
+        payload: dict[str, Any] = {
+            "clientId": self.client_id,
+            "friendlyName": self.friendly_name,
+            "layout": self.layout,
+            "font": self.font,
+            "background": self.background,
+            "zoneId": self.zone_id,
+            "zoneName": self.zone_name,
+        }
+        if not self.connected:
+            payload["_disconnected"] = True
+        return payload
+
+
+@dataclass(slots=True, frozen=True)
+class ZoneState:
+    """A Roon zone."""
+
+    zone_id: str
+    display_name: str
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> ZoneState:
+        """Parse a zone as sent by the server."""
+        return cls(zone_id=payload["id"], display_name=payload["display_name"])
+
+    def as_payload(self) -> dict[str, str]:
+        """Return the zone in the server's format (used for the snapshot)."""
+        return {"id": self.zone_id, "display_name": self.display_name}
+
+
+@dataclass(slots=True, frozen=True)
+class NowPlaying:
+    """Playback state of a Roon zone."""
+
+    zone_id: str
+    state: str | None = None
+    title: str | None = None
+    artist: str | None = None
+    album: str | None = None
+    duration: int | None = None  # seconds
+    image_key: str | None = None
+    position: float | None = None  # seconds, as of position_updated_at
+    position_updated_at: datetime | None = None
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any], now: datetime) -> NowPlaying:
+        """Parse a now_playing frame as sent by the server."""
+        track = payload.get("track") or {}
+        position = payload.get("seek_position")
+        return cls(
+            zone_id=payload["zoneId"],
+            state=payload.get("state"),
+            title=track.get("title"),
+            artist=track.get("artist"),
+            album=track.get("album"),
+            duration=track.get("duration"),
+            image_key=track.get("image_key"),
+            position=position,
+            position_updated_at=now if position is not None else None,
+        )
+
+    def same_track(self, other: NowPlaying) -> bool:
+        """Return True if both describe the same track."""
+        return (self.title, self.artist, self.album, self.duration) == (
+            other.title,
+            other.artist,
+            other.album,
+            other.duration,
+        )
+
+    def position_at(self, now: datetime) -> float | None:
+        """Return the position a client interpolating from the last update shows."""
+        if self.position is None or self.position_updated_at is None:
+            return None
+        if self.state != "playing":
+            return self.position
+        return self.position + (now - self.position_updated_at).total_seconds()
@@ -0,0 +1,165 @@
+"""On-demand profiling of the coordinator hot paths."""
+from __future__ import annotations
+
+import asyncio
+import cProfile
+from collections.abc import Callable, Iterable
+import functools
+import io
+import logging
+from pathlib import Path
+import pstats
+import tracemalloc
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .coordinator import RoonNowPlayingCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Coordinator methods wrapped while profiling: message handling, and the
+# publish that fans out to listeners and entity state writes
+PROFILED_METHODS = ("_handle_message", "_async_publish")
+TRACEMALLOC_FRAMES = 10
+# Allocations are reported for the integration's own files, minus the profiler
+TRACEMALLOC_FILTERS = [
+    tracemalloc.Filter(True, str(Path(__file__).parent / "*")),
+    tracemalloc.Filter(False, __file__),
+]
+
+
+class ProfilingSession:
+    """Profile coordinator methods by shadowing them on the instances.
+
+    Nothing is wrapped outside a session, so profiling costs nothing when
+    it is off; stopping deletes the instance attributes and the class
+    methods are used again.
+    """
+
+    def __init__(
+        self,
+        coordinators: Iterable[RoonNowPlayingCoordinator],
+        max_messages: int | None,
+    ) -> None:
+        """Initialize the session."""
+        self._coordinators = list(coordinators)
+        self._max_messages = max_messages
+        self.profiler = cProfile.Profile()
+        self.messages = 0
+        self.done = asyncio.Event()
+
+    def start(self) -> None:
+        """Wrap the profiled methods of every coordinator."""
+        for coordinator in self._coordinators:
+            for name in PROFILED_METHODS:
+                method = getattr(coordinator, name)
+                setattr(coordinator, name, self._wrap(method, name))
+
+    def stop(self) -> None:
+        """Restore the class methods."""
+        for coordinator in self._coordinators:
+            for name in PROFILED_METHODS:
+                vars(coordinator).pop(name, None)
+
+    def _wrap(self, method: Callable[..., Any], name: str) -> Callable[..., Any]:
+        """Return the method running under the profiler."""
+        profiler = self.profiler
+        counts_messages = name == "_handle_message"
+
+        @functools.wraps(method)
+        def wrapper(*args: Any) -> Any:
+            profiler.enable()
+            try:
+                return method(*args)
+            finally:
+                profiler.disable()
+                if counts_messages:
+                    self.messages += 1
+                    if self._max_messages and self.messages >= self._max_messages:
+                        self.done.set()
+
+        return wrapper
+
+
+async def async_profile(
+    hass: HomeAssistant,
+    coordinators: Iterable[RoonNowPlayingCoordinator],
+    duration: float,
+    max_messages: int | None,
+    top: int,
+) -> dict[str, Any]:
+    """Profile for a duration or number of messages and write the reports."""
+    session = ProfilingSession(coordinators, max_messages)
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start(TRACEMALLOC_FRAMES)
+    before = await hass.async_add_executor_job(_take_snapshot)
+    session.start()
+    try:
+        async with asyncio.timeout(duration):
+            await session.done.wait()
+    except TimeoutError:
+        pass
+    finally:
+        session.stop()
+        after = await hass.async_add_executor_job(_take_snapshot)
+        if started_tracing:
+            tracemalloc.stop()
+
+    stamp = dt_util.now().strftime("%Y%m%d_%H%M%S")
+    directory = Path(hass.config.path(DOMAIN))
+    # Without a handled message or publish there is nothing to load in pstats
+    stats_path: Path | None = (
+        directory / f"profile_{stamp}.pstats" if session.profiler.getstats() else None
+    )
+    allocations_path = directory / f"allocations_{stamp}.txt"
+    await hass.async_add_executor_job(
+        _write_reports,
+        session.profiler,
+        before,
+        after,
+        top,
+        stats_path,
+        allocations_path,
+    )
+    _LOGGER.info(
+        "Profiled %d messages, reports written to %s", session.messages, directory
+    )
+    return {
+        "messages": session.messages,
+        "pstats": str(stats_path) if stats_path else None,
+        "allocations": str(allocations_path),
+    }
+
+
+def _take_snapshot() -> tracemalloc.Snapshot:
+    """Return the traced allocations of the integration (executor)."""
+    return tracemalloc.take_snapshot().filter_traces(TRACEMALLOC_FILTERS)
+
+
+def _write_reports(
+    profiler: cProfile.Profile,
+    before: tracemalloc.Snapshot,
+    after: tracemalloc.Snapshot,
+    top: int,
+    stats_path: Path | None,
+    allocations_path: Path,
+) -> None:
+    """Write the pstats file and the top allocations (executor)."""
+    allocations_path.parent.mkdir(parents=True, exist_ok=True)
+    lines = [f"Top {top} allocation sites by growth during the session", ""]
+    lines.extend(str(stat) for stat in after.compare_to(before, "lineno")[:top])
+    lines.extend(["", "Profile by cumulative time"])
+    if stats_path is None:
+        lines.append("No samples: no message was handled during the session")
+    else:
+        profiler.dump_stats(stats_path)
+        summary = io.StringIO()
+        pstats.Stats(profiler, stream=summary).sort_stats("cumulative").print_stats(
+            top
+        )
+        lines.append(summary.getvalue())
+    allocations_path.write_text("\n".join(lines), encoding="utf-8")
@@ -0,0 +1,128 @@
+"""WebSocket message decoding and buffering for Roon Now Playing."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Callable
+import json
+import re
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    orjson = None
+
+JsonLoads = Callable[[str | bytes], Any]
+
+# The server puts the message type first; match it without decoding the frame
+_TYPE_PREFIX = re.compile(r'\s*\{\s*"type"\s*:\s*"([^"\\]*)"')
+_SEQ = re.compile(r'"seq"\s*:\s*(\d+)')
+
+
+def get_json_loads() -> JsonLoads:
+    """Return the fastest available JSON decoder (orjson, else stdlib)."""
+    if orjson is not None:
+        return orjson.loads
+    return json.loads
+
+
+def sniff_type(text: str) -> str | None:
+    """Return the message type if it is the frame's first key.
+
+    Returns None when the type cannot be read cheaply; the caller then
+    decodes the whole frame.
+    """
+    match = _TYPE_PREFIX.match(text)
+    return match.group(1) if match else None
+
+
+def sniff_seq(text: str) -> int | None:
+    """Return the sequence number of a frame that is not decoded."""
+    match = _SEQ.search(text)
+    return int(match.group(1)) if match else None
+
+
+class SequenceTracker:
+    """Detect frames missed between server sequence numbers."""
+
+    def __init__(self) -> None:
+        """Initialize the tracker."""
+        self.last: int | None = None
+        self.gaps = 0
+        self.missed = 0
+
+    def reset(self) -> None:
+        """Forget the last sequence number (new connection)."""
+        self.last = None
+
+    def observe(self, seq: int) -> bool:
+        """Record a sequence number; returns True if frames were missed."""
+        last, self.last = self.last, seq
+        # First frame, or the server restarted its numbering
+        if last is None or seq <= last or seq == last + 1:
+            return False
+        self.gaps += 1
+        self.missed += seq - last - 1
+        return True
+
+
+class InboundQueue:
+    """Bounded queue between the socket reader and the message handler.
+
+    When the queue is full, a client_updated frame replaces the queued one
+    for the same client (latest wins) instead of waiting; other frames make
+    the reader wait, which stops reading from the socket. Any frame that is
+    not coalescable acts as a barrier so frames are never reordered across
+    it.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """Initialize the queue."""
+        self.maxsize = maxsize
+        # Entries are [coalesce key, message]; the message may be replaced
+        self._items: deque[list[Any]] = deque()
+        # Coalesce key -> queued entry that a newer frame may replace
+        self._latest: dict[str, list[Any]] = {}
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self.max_depth = 0
+        self.dropped = 0
+        self.blocked = 0
+
+    @property
+    def depth(self) -> int:
+        """Return the number of queued messages."""
+        return len(self._items)
+
+    async def put(self, message: Any, coalesce_key: str | None) -> None:
+        """Queue a message, waiting while the queue is full."""
+        while len(self._items) >= self.maxsize:
+            if coalesce_key is not None and (entry := self._latest.get(coalesce_key)):
+                # Superseded frame is dropped in place
+                entry[1] = message
+                self.dropped += 1
+                return
+            self.blocked += 1
+            self._not_full.clear()
+            await self._not_full.wait()
+
+        entry = [coalesce_key, message]
+        self._items.append(entry)
+        if coalesce_key is None:
+            self._latest.clear()
+        else:
+            self._latest[coalesce_key] = entry
+        self.max_depth = max(self.max_depth, len(self._items))
+        self._not_empty.set()
+
+    async def get(self) -> Any:
+        """Return the next message, waiting while the queue is empty."""
+        while not self._items:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        entry = self._items.popleft()
+        if entry[0] is not None and self._latest.get(entry[0]) is entry:
+            del self._latest[entry[0]]
+        self._not_full.set()
+        return entry[1]
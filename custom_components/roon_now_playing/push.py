@@ -0,0 +1,95 @@
+"""Outbound settings push queue for Roon Now Playing."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import logging
+
+from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+PUSH_COALESCE_WINDOW = 0.05  # seconds
+
+
+class ClientPushQueue:
+    """Merge settings pushed to one client into as few requests as possible.
+
+    Changes queued within the coalescing window are sent as one payload. A
+    newer value for a pending field replaces the older one (last writer wins)
+    and only one request per client is in flight at a time. Every caller
+    waiting on a field gets the result of the request that carried its final
+    value.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client_id: str,
+        send: Callable[[str, dict[str, str]], Awaitable[bool]],
+        window: float = PUSH_COALESCE_WINDOW,
+    ) -> None:
+        """Initialize the queue."""
+        self._hass = hass
+        self._client_id = client_id
+        self._send = send
+        self._window = window
+        self._pending: dict[str, str] = {}
+        self._waiters: dict[str, list[asyncio.Future[bool]]] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    async def async_push(self, fields: dict[str, str]) -> dict[str, bool]:
+        """Queue fields for the client and return the per-field result."""
+        futures: dict[str, asyncio.Future[bool]] = {}
+        for field, value in fields.items():
+            self._pending[field] = value
+            future = self._hass.loop.create_future()
+            self._waiters.setdefault(field, []).append(future)
+            futures[field] = future
+
+        if self._task is None:
+            self._task = self._hass.async_create_background_task(
+                self._async_run(), f"roon_now_playing push {self._client_id}"
+            )
+
+        results = await asyncio.gather(*futures.values())
+        return dict(zip(futures, results))
+
+    async def async_cancel(self) -> None:
+        """Cancel the in-flight request and fail pending fields."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def _async_run(self) -> None:
+        """Send pending fields until the queue is drained."""
+        try:
+            await asyncio.sleep(self._window)
+            while self._pending:
+                payload, self._pending = self._pending, {}
+                waiters, self._waiters = self._waiters, {}
+                success = False
+                try:
+                    success = await self._send(self._client_id, payload)
+                finally:
+                    _resolve(waiters, success)
+        finally:
+            self._task = None
+            pending, self._pending = self._pending, {}
+            if pending:
+                _LOGGER.debug(
+                    "Dropped pending settings for %s: %s", self._client_id, pending
+                )
+            waiters, self._waiters = self._waiters, {}
+            _resolve(waiters, False)
+
+
+def _resolve(waiters: dict[str, list[asyncio.Future[bool]]], success: bool) -> None:
+    """Resolve waiting callers with the outcome of their request."""
+    for futures in waiters.values():
+        for future in futures:
+            if not future.done():
+                future.set_result(success)
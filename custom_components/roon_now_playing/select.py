@@ -7,20 +7,19 @@ from typing import Any
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import BACKGROUNDS, DOMAIN, FONTS, LAYOUTS
+from .const import DOMAIN
 from .coordinator import RoonNowPlayingCoordinator
+from .entity import RoonNowPlayingEntity
 
 
 @dataclass(frozen=True)
 class RoonNowPlayingSelectDescription(SelectEntityDescription):
     """Describe a Roon Now Playing select entity."""
 
-    options_key: str | None = None  # For dynamic options (zones)
-    static_options: list[str] | None = None  # For static options
+    # Zones, or the option list of the same name in the server capabilities
+    options_key: str | None = None
 
 
 SELECT_TYPES: tuple[RoonNowPlayingSelectDescription, ...] = (
@@ -28,19 +27,19 @@ SELECT_TYPES: tuple[RoonNowPlayingSelectDescription, ...] = (
         key="layout",
         name="Layout",
         icon="mdi:page-layout-body",
-        static_options=LAYOUTS,
+        options_key="layouts",
     ),
     RoonNowPlayingSelectDescription(
         key="font",
         name="Font",
         icon="mdi:format-font",
-        static_options=FONTS,
+        options_key="fonts",
     ),
     RoonNowPlayingSelectDescription(
         key="background",
         name="Background",
         icon="mdi:palette",
-        static_options=BACKGROUNDS,
+        options_key="backgrounds",
     ),
     RoonNowPlayingSelectDescription(
         key="zone",
@@ -59,42 +58,29 @@ async def async_setup_entry(
     """Set up select entities from a config entry."""
     coordinator: RoonNowPlayingCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    # Track which friendly names we've added entities for (prevents duplicates on reconnect)
-    tracked_names: set[str] = set()
-
     @callback
-    def async_add_new_entities() -> None:
-        """Add entities for new named clients."""
-        new_entities = []
-
-        for client_id, client in coordinator.clients.items():
-            friendly_name = client.get("friendlyName")
-            if friendly_name and friendly_name not in tracked_names:
-                tracked_names.add(friendly_name)
-                for description in SELECT_TYPES:
-                    new_entities.append(
-                        RoonNowPlayingSelect(coordinator, friendly_name, description)
-                    )
-
-        if new_entities:
-            async_add_entities(new_entities)
+    def async_add_screen(friendly_name: str) -> None:
+        """Add entities for a newly named screen."""
+        async_add_entities(
+            RoonNowPlayingSelect(coordinator, friendly_name, description)
+            for description in SELECT_TYPES
+        )
 
     # Add initial entities
-    async_add_new_entities()
-
-    # Listen for new clients
-    entry.async_on_unload(
-        coordinator.async_add_listener(async_add_new_entities)
+    async_add_entities(
+        RoonNowPlayingSelect(coordinator, friendly_name, description)
+        for friendly_name in coordinator.screens
+        for description in SELECT_TYPES
     )
 
+    # Listen for new screens
+    entry.async_on_unload(coordinator.async_add_new_screen_listener(async_add_screen))
 
-class RoonNowPlayingSelect(
-    CoordinatorEntity[RoonNowPlayingCoordinator], SelectEntity
-):
+
+class RoonNowPlayingSelect(RoonNowPlayingEntity, SelectEntity):
     """Select entity for Roon Now Playing settings."""
 
     entity_description: RoonNowPlayingSelectDescription
-    _attr_has_entity_name = True
 
     def __init__(
         self,
@@ -103,48 +89,26 @@ class RoonNowPlayingSelect(
         description: RoonNowPlayingSelectDescription,
     ) -> None:
         """Initialize the select entity."""
-        super().__init__(coordinator)
-        self._friendly_name = friendly_name
+        super().__init__(coordinator, friendly_name, description.key)
         self.entity_description = description
-        # Use friendly_name for unique_id to survive reconnects with new client_id
-        self._attr_unique_id = f"{friendly_name.lower().replace(' ', '_')}_{description.key}"
-
-    @property
-    def _client(self) -> dict | None:
-        """Return the client data by friendly name (prefers connected clients)."""
-        matching_clients = [
-            client for client in self.coordinator._clients.values()
-            if client.get("friendlyName") == self._friendly_name
-        ]
-        if not matching_clients:
-            return None
-        # Prefer connected clients over disconnected ones
-        for client in matching_clients:
-            if not client.get("_disconnected", False):
-                return client
-        # All are disconnected, return the first one
-        return matching_clients[0]
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._friendly_name)},
-            name=self._friendly_name,
-            manufacturer="Roon Now Playing",
-            model="Display Screen",
-        )
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to zone list changes for the zone select."""
+        await super().async_added_to_hass()
+        if self.entity_description.options_key == "zones":
+            self.async_on_remove(
+                self.coordinator.async_add_zones_listener(self._handle_client_update)
+            )
 
     @property
     def options(self) -> list[str]:
-        """Return available options."""
-        if self.entity_description.static_options:
-            return list(self.entity_description.static_options)
-
-        # Dynamic options (zones)
-        if self.entity_description.options_key == "zones":
-            return [zone["display_name"] for zone in self.coordinator.zones]
-
+        """Return available options (cached, never rebuilt per call)."""
+        options_key = self.entity_description.options_key
+        if options_key == "zones":
+            return self.coordinator.zone_index.options
+        if options_key is not None:
+            # Option lists of the connected server version
+            return getattr(self.coordinator.capabilities, options_key)
         return []
 
     @property
@@ -155,9 +119,12 @@ class RoonNowPlayingSelect(
             return None
 
         key = self.entity_description.key
+        optimistic = self.coordinator.get_optimistic(self._friendly_name, key)
+        if optimistic is not None:
+            return optimistic
         if key == "zone":
-            return client.get("zoneName")
-        return client.get(key)
+            return client.zone_name
+        return getattr(client, key)
 
     @property
     def available(self) -> bool:
@@ -165,7 +132,12 @@ class RoonNowPlayingSelect(
         client = self._client
         if not client:
             return False
-        return not client.get("_disconnected", False)
+        # Restored settings stay usable until the server answers
+        return client.connected or self.coordinator.stale
+
+    def _state_key(self) -> tuple[Any, ...]:
+        """Return the derived state used to detect no-op updates."""
+        return (self.available, self.current_option, self.options)
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
@@ -173,32 +145,21 @@ class RoonNowPlayingSelect(
         if not client:
             return
 
-        client_id = client.get("clientId")
-        if not client_id:
-            return
+        client_id = client.client_id
 
         key = self.entity_description.key
 
-        if key == "layout":
-            await self.coordinator.async_push_settings(
-                client_id, layout=option
-            )
-        elif key == "font":
-            await self.coordinator.async_push_settings(
-                client_id, font=option
-            )
-        elif key == "background":
-            await self.coordinator.async_push_settings(
-                client_id, background=option
-            )
-        elif key == "zone":
-            # Find zone ID from name
-            zone_id = None
-            for zone in self.coordinator.zones:
-                if zone["display_name"] == option:
-                    zone_id = zone["id"]
-                    break
-            if zone_id:
-                await self.coordinator.async_push_settings(
-                    client_id, zone_id=zone_id
-                )
+        if key == "zone":
+            zone_id = self.coordinator.zone_index.id_for_name(option)
+            if not zone_id:
+                return
+            settings = {"zone_id": zone_id}
+        else:
+            settings = {key: option}
+
+        # Show the new option right away; the coordinator reconciles it with
+        # the confirming client_updated or reverts it
+        self.coordinator.async_set_optimistic(self._friendly_name, key, option)
+        results = await self.coordinator.async_push_settings(client_id, **settings)
+        if not all(results.values()):
+            self.coordinator.async_rollback_optimistic(self._friendly_name, key, option)
@@ -0,0 +1,188 @@
+"""Diagnostic sensor platform for Roon Now Playing."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import (
+    PERCENTAGE,
+    EntityCategory,
+    UnitOfInformation,
+    UnitOfTime,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import StateType
+
+from .const import DOMAIN
+from .coordinator import RoonNowPlayingCoordinator
+
+# Metrics change continuously; refresh them on a fixed interval
+SCAN_INTERVAL = timedelta(seconds=30)
+PARALLEL_UPDATES = 0
+
+
+def _ms(seconds: float | None) -> float | None:
+    """Convert seconds to milliseconds."""
+    return None if seconds is None else seconds * 1000
+
+
+def _percent(ratio: float | None) -> float | None:
+    """Convert a ratio to a percentage."""
+    return None if ratio is None else ratio * 100
+
+
+@dataclass(frozen=True, kw_only=True)
+class RoonNowPlayingSensorDescription(SensorEntityDescription):
+    """Describe a Roon Now Playing diagnostic sensor."""
+
+    value_fn: Callable[[RoonNowPlayingCoordinator], StateType | object]
+
+
+SENSOR_TYPES: tuple[RoonNowPlayingSensorDescription, ...] = (
+    RoonNowPlayingSensorDescription(
+        key="message_rate",
+        name="Message rate",
+        icon="mdi:message-processing",
+        native_unit_of_measurement="messages/s",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        value_fn=lambda coordinator: coordinator.metrics.messages.rate(),
+    ),
+    RoonNowPlayingSensorDescription(
+        key="handle_time_p50",
+        name="Message handling time p50",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=3,
+        value_fn=lambda coordinator: _ms(
+            coordinator.metrics.handle_time.percentile(50)
+        ),
+    ),
+    RoonNowPlayingSensorDescription(
+        key="handle_time_p99",
+        name="Message handling time p99",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=3,
+        value_fn=lambda coordinator: _ms(
+            coordinator.metrics.handle_time.percentile(99)
+        ),
+    ),
+    RoonNowPlayingSensorDescription(
+        key="fanout_time_p99",
+        name="Listener fan-out time p99",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=3,
+        value_fn=lambda coordinator: _ms(
+            coordinator.metrics.fanout_time.percentile(99)
+        ),
+    ),
+    RoonNowPlayingSensorDescription(
+        key="push_rtt_p50",
+        name="Push round-trip time",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        value_fn=lambda coordinator: _ms(coordinator.metrics.push_rtt.percentile(50)),
+    ),
+    RoonNowPlayingSensorDescription(
+        key="push_error_rate",
+        name="Push error rate",
+        icon="mdi:alert-circle-outline",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        value_fn=lambda coordinator: _percent(
+            coordinator.metrics.push_failures.mean()
+        ),
+    ),
+    RoonNowPlayingSensorDescription(
+        key="reconnects",
+        name="Reconnects",
+        icon="mdi:connection",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coordinator: coordinator.connection_stats.reconnects,
+    ),
+    RoonNowPlayingSensorDescription(
+        key="connected_since",
+        name="Connected since",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        value_fn=lambda coordinator: coordinator.connection_stats.connected_at,
+    ),
+    RoonNowPlayingSensorDescription(
+        key="clients",
+        name="Tracked clients",
+        icon="mdi:monitor-multiple",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: coordinator.client_count,
+    ),
+    RoonNowPlayingSensorDescription(
+        key="artwork_hit_rate",
+        name="Artwork cache hit rate",
+        icon="mdi:image-multiple",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        value_fn=lambda coordinator: _percent(coordinator.artwork.stats.hit_rate),
+    ),
+    RoonNowPlayingSensorDescription(
+        key="artwork_cache_size",
+        name="Artwork cache size",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        suggested_unit_of_measurement=UnitOfInformation.MEBIBYTES,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: coordinator.artwork.bytes,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up diagnostic sensors from a config entry."""
+    coordinator: RoonNowPlayingCoordinator = hass.data[DOMAIN][entry.entry_id]
+    async_add_entities(
+        RoonNowPlayingDiagnosticSensor(coordinator, description)
+        for description in SENSOR_TYPES
+    )
+
+
+class RoonNowPlayingDiagnosticSensor(SensorEntity):
+    """Runtime metric of the server connection, on the server device."""
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    entity_description: RoonNowPlayingSensorDescription
+
+    def __init__(
+        self,
+        coordinator: RoonNowPlayingCoordinator,
+        description: RoonNowPlayingSensorDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        self.coordinator = coordinator
+        self.entity_description = description
+        self._attr_unique_id = f"{coordinator.entry.entry_id}_{description.key}"
+        self._attr_device_info = coordinator.hub_device_info
+
+    @property
+    def native_value(self) -> StateType | object:
+        """Return the current value of the metric."""
+        return self.entity_description.value_fn(self.coordinator)
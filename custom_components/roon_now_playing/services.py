@@ -0,0 +1,220 @@
+"""Services for Roon Now Playing."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+
+from .const import DOMAIN
+from .coordinator import RoonNowPlayingCoordinator
+from .profiler import async_profile
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_APPLY_PROFILE = "apply_profile"
+SERVICE_PROFILE = "profile"
+
+ATTR_SCREENS = "screens"
+ATTR_DEVICE_ID = "device_id"
+ATTR_LAYOUT = "layout"
+ATTR_FONT = "font"
+ATTR_BACKGROUND = "background"
+ATTR_ZONE = "zone"
+ATTR_MAX_CONCURRENCY = "max_concurrency"
+ATTR_TIMEOUT = "timeout"
+ATTR_DURATION = "duration"
+ATTR_MESSAGES = "messages"
+ATTR_TOP = "top"
+
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_TIMEOUT = 10  # seconds
+DEFAULT_PROFILE_DURATION = 30  # seconds
+DEFAULT_PROFILE_TOP = 25
+
+APPLY_PROFILE_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional(ATTR_SCREENS): vol.All(cv.ensure_list, [cv.string]),
+            vol.Optional(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+            # Checked per screen against the option lists of its server
+            vol.Optional(ATTR_LAYOUT): cv.string,
+            vol.Optional(ATTR_FONT): cv.string,
+            vol.Optional(ATTR_BACKGROUND): cv.string,
+            vol.Optional(ATTR_ZONE): cv.string,
+            vol.Optional(
+                ATTR_MAX_CONCURRENCY, default=DEFAULT_MAX_CONCURRENCY
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=64)),
+            vol.Optional(ATTR_TIMEOUT, default=DEFAULT_TIMEOUT): vol.All(
+                vol.Coerce(float), vol.Range(min=1, max=120)
+            ),
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_SCREENS, ATTR_DEVICE_ID),
+    cv.has_at_least_one_key(ATTR_LAYOUT, ATTR_FONT, ATTR_BACKGROUND, ATTR_ZONE),
+)
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DURATION, default=DEFAULT_PROFILE_DURATION): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=600)
+        ),
+        vol.Optional(ATTR_MESSAGES): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional(ATTR_TOP, default=DEFAULT_PROFILE_TOP): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=200)
+        ),
+    }
+)
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services."""
+
+    async def async_apply_profile(call: ServiceCall) -> ServiceResponse:
+        """Apply a profile to several screens concurrently."""
+        targets = _resolve_targets(hass, call.data)
+        if not any(targets.values()):
+            raise ServiceValidationError("No matching Roon Now Playing screens found")
+
+        semaphore = asyncio.Semaphore(call.data[ATTR_MAX_CONCURRENCY])
+        timeout: float = call.data[ATTR_TIMEOUT]
+
+        async def apply(
+            coordinator: RoonNowPlayingCoordinator | None, friendly_name: str
+        ) -> dict[str, Any]:
+            if coordinator is None:
+                return {"success": False, "error": "not found"}
+            async with semaphore:
+                return await _async_apply_to_screen(
+                    coordinator, friendly_name, call.data, timeout
+                )
+
+        results = await asyncio.gather(
+            *(apply(coordinator, name) for name, coordinator in targets.items())
+        )
+        screens = dict(zip(targets, results))
+        succeeded = sum(1 for result in results if result["success"])
+        return {
+            "screens": screens,
+            "succeeded": succeeded,
+            "failed": len(results) - succeeded,
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_APPLY_PROFILE,
+        async_apply_profile,
+        schema=APPLY_PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    profiling = asyncio.Lock()
+
+    async def async_profile_coordinators(call: ServiceCall) -> ServiceResponse:
+        """Profile message handling and listener fan-out."""
+        coordinators: dict[str, RoonNowPlayingCoordinator] = hass.data.get(DOMAIN, {})
+        if not coordinators:
+            raise ServiceValidationError("No Roon Now Playing server is set up")
+        if profiling.locked():
+            raise ServiceValidationError("A profiling session is already running")
+        async with profiling:
+            return await async_profile(
+                hass,
+                coordinators.values(),
+                call.data[ATTR_DURATION],
+                call.data.get(ATTR_MESSAGES),
+                call.data[ATTR_TOP],
+            )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        async_profile_coordinators,
+        schema=PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+def _resolve_targets(
+    hass: HomeAssistant, data: dict[str, Any]
+) -> dict[str, RoonNowPlayingCoordinator | None]:
+    """Map requested screens and devices to the coordinator serving them.
+
+    Screens no coordinator knows map to None.
+    """
+    coordinators: dict[str, RoonNowPlayingCoordinator] = hass.data.get(DOMAIN, {})
+    names: set[str] = set(data.get(ATTR_SCREENS, []))
+
+    # Server devices are identified by their entry id and are not screens
+    entry_ids = {entry.entry_id for entry in hass.config_entries.async_entries(DOMAIN)}
+    device_registry = dr.async_get(hass)
+    for device_id in data.get(ATTR_DEVICE_ID, []):
+        if (device := device_registry.async_get(device_id)) is None:
+            continue
+        names.update(
+            identifier
+            for domain, identifier in device.identifiers
+            if domain == DOMAIN and identifier not in entry_ids
+        )
+
+    targets: dict[str, RoonNowPlayingCoordinator | None] = {}
+    for name in sorted(names):
+        for coordinator in coordinators.values():
+            if coordinator.get_client(name) is not None:
+                targets[name] = coordinator
+                break
+        else:
+            _LOGGER.warning("Screen %s not found", name)
+            targets[name] = None
+    return targets
+
+
+async def _async_apply_to_screen(
+    coordinator: RoonNowPlayingCoordinator,
+    friendly_name: str,
+    data: dict[str, Any],
+    timeout: float,
+) -> dict[str, Any]:
+    """Push a profile to one screen and describe the outcome."""
+    client = coordinator.get_client(friendly_name)
+    if client is None or not client.connected:
+        return {"success": False, "error": "disconnected"}
+
+    capabilities = coordinator.capabilities
+    for attr, options in (
+        (ATTR_LAYOUT, capabilities.layouts),
+        (ATTR_FONT, capabilities.fonts),
+        (ATTR_BACKGROUND, capabilities.backgrounds),
+    ):
+        if (value := data.get(attr)) is not None and value not in options:
+            return {"success": False, "error": f"unsupported {attr} {value}"}
+
+    zone_id: str | None = None
+    if (zone_name := data.get(ATTR_ZONE)) is not None:
+        zone_id = coordinator.zone_index.id_for_name(zone_name)
+        if zone_id is None:
+            return {"success": False, "error": f"unknown zone {zone_name}"}
+
+    try:
+        async with asyncio.timeout(timeout):
+            fields = await coordinator.async_push_settings(
+                client.client_id,
+                layout=data.get(ATTR_LAYOUT),
+                font=data.get(ATTR_FONT),
+                background=data.get(ATTR_BACKGROUND),
+                zone_id=zone_id,
+            )
+    except TimeoutError:
+        return {"success": False, "error": "timeout"}
+
+    return {"success": all(fields.values()), "fields": fields}